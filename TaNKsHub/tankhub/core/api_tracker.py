@@ -1,19 +1,99 @@
 import json
+from collections import deque
 from datetime import datetime, timedelta
 import os
 from pathlib import Path
+import atexit
+import threading
+import time
 import logging
+from typing import Dict
+from tankhub.core.json_io import read_json, write_json
 
 logger = logging.getLogger(__name__)
 
+# Seconds to batch record_api_call updates before writing them to disk
+SAVE_DELAY = 5.0
+
+# Number of past days kept in each API's daily_history
+HISTORY_DAYS = 30
+
+# Default statistics file, shared by every part of the app that tracks API calls
+STATS_FILE = 'config/api_usage.json'
+
+# Key in the stats file holding the sequence number of the last journaled call
+# the snapshot includes; it is not an API name
+_JOURNAL_SEQ_KEY = "_journal_seq"
+
+def _as_history(history=None):
+    """Return daily history as a bounded deque of [date, calls] pairs, oldest first.
+
+    Older stats files stored the history as a {date: calls} dict.
+    """
+    if isinstance(history, dict):
+        history = sorted(history.items())
+    return deque((list(day) for day in history or ()), maxlen=HISTORY_DAYS)
+
+def _default_api_stats(today):
+    """Return a fresh stats entry for an API with no recorded calls."""
+    return {
+        "daily_limit": 1000,  # Default limit (OMDb and TMDb free tiers)
+        "calls_today": 0,
+        "last_reset": today,
+        "total_calls": 0,
+        "successful_calls": 0,
+        "failed_calls": 0,
+        "daily_history": _as_history()  # Store daily usage counts
+    }
+
 class APIUsageTracker:
-    """Track API usage statistics for external services."""
+    """Track API usage statistics for external services.
     
-    def __init__(self):
-        self.stats_file = Path('config/api_usage.json')
+    Use APIUsageTracker.shared() rather than creating trackers directly: each
+    stats file (and its journal) must have exactly one tracker writing it.
+    """
+    
+    # One tracker per stats file, by absolute path
+    _shared: Dict[str, 'APIUsageTracker'] = {}
+    _shared_lock = threading.Lock()
+    
+    @classmethod
+    def shared(cls, stats_file=STATS_FILE):
+        """Return the tracker for stats_file, creating it on first use."""
+        key = os.path.abspath(stats_file)
+        with cls._shared_lock:
+            tracker = cls._shared.get(key)
+            if tracker is None:
+                tracker = cls._shared[key] = cls(stats_file)
+            return tracker
+    
+    def __init__(self, stats_file=STATS_FILE):
+        self.stats_file = Path(stats_file)
+        # Append-only log of calls made since the last snapshot was written
+        self.journal_file = self.stats_file.with_suffix('.log')
+        self._journal = None
+        # Sequence number of the last call written to the journal
+        self._journal_seq = 0
         self.usage_stats = {}
+        # Calls are recorded from worker threads; guards usage_stats and saves
+        self._lock = threading.RLock()
+        self._dirty = False
+        self._save_timer = None
+        # Cached date string and the epoch time at which it goes stale
+        self._today_str = None
+        self._today_expires = 0.0
         self._load_stats()
+        atexit.register(self.flush)
         
+    def _today(self):
+        """Return today's date as YYYY-MM-DD, recomputed only after midnight."""
+        if time.time() >= self._today_expires:
+            now = datetime.now()
+            self._today_str = now.strftime("%Y-%m-%d")
+            midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+            self._today_expires = midnight.timestamp()
+        return self._today_str
+    
     def _load_stats(self):
         """Load existing API stats from file."""
         try:
@@ -21,30 +101,17 @@ class APIUsageTracker:
             self.stats_file.parent.mkdir(parents=True, exist_ok=True)
             
             if self.stats_file.exists():
-                with open(self.stats_file, 'r') as f:
-                    self.usage_stats = json.load(f)
+                self.usage_stats = read_json(self.stats_file)
+                self._journal_seq = self.usage_stats.pop(_JOURNAL_SEQ_KEY, 0)
+                for stats in self.usage_stats.values():
+                    stats["daily_history"] = _as_history(stats.get("daily_history"))
                 logger.info("Loaded API usage statistics")
+                self._replay_journal()
             else:
                 # Initialize with default structure
                 self.usage_stats = {
-                    "omdb": {
-                        "daily_limit": 1000,  # Default OMDb free tier limit
-                        "calls_today": 0,
-                        "last_reset": datetime.now().strftime("%Y-%m-%d"),
-                        "total_calls": 0,
-                        "successful_calls": 0,
-                        "failed_calls": 0,
-                        "daily_history": {}  # Store daily usage counts
-                    },
-                    "tmdb": {
-                        "daily_limit": 1000,  # Default TMDb limit
-                        "calls_today": 0,
-                        "last_reset": datetime.now().strftime("%Y-%m-%d"),
-                        "total_calls": 0,
-                        "successful_calls": 0,
-                        "failed_calls": 0,
-                        "daily_history": {}  # Store daily usage counts
-                    }
+                    "omdb": _default_api_stats(self._today()),
+                    "tmdb": _default_api_stats(self._today())
                 }
                 self._save_stats()
                 logger.info("Created default API usage statistics")
@@ -52,147 +119,241 @@ class APIUsageTracker:
             logger.error(f"Error loading API usage statistics: {str(e)}")
             # Create default stats on error
             self.usage_stats = {
-                "omdb": {"daily_limit": 1000, "calls_today": 0, "last_reset": datetime.now().strftime("%Y-%m-%d"), "total_calls": 0, "successful_calls": 0, "failed_calls": 0, "daily_history": {}},
-                "tmdb": {"daily_limit": 1000, "calls_today": 0, "last_reset": datetime.now().strftime("%Y-%m-%d"), "total_calls": 0, "successful_calls": 0, "failed_calls": 0, "daily_history": {}}
+                "omdb": _default_api_stats(self._today()),
+                "tmdb": _default_api_stats(self._today())
             }
     
     def _save_stats(self):
         """Save current API usage statistics to file."""
         try:
-            with open(self.stats_file, 'w') as f:
-                json.dump(self.usage_stats, f, indent=4)
+            with self._lock:
+                # Compact form: this is rewritten after every burst of API calls.
+                # The sequence marker lets a replay skip calls the snapshot already
+                # holds if the process dies before the journal is emptied.
+                snapshot = dict(self.usage_stats)
+                snapshot[_JOURNAL_SEQ_KEY] = self._journal_seq
+                write_json(self.stats_file, snapshot, indent=None, default=list)
+                self._dirty = False
+                # The snapshot now contains every journaled call
+                self._truncate_journal()
             logger.info("Saved API usage statistics")
         except Exception as e:
             logger.error(f"Error saving API usage statistics: {str(e)}")
     
-    def _check_day_reset(self, api_name):
-        """Check if we need to reset the daily counter."""
-        today = datetime.now().strftime("%Y-%m-%d")
-        last_reset = self.usage_stats[api_name]["last_reset"]
+    def _append_journal(self, api_name, success):
+        """Append a single call event to the journal file."""
+        try:
+            if self._journal is None:
+                self._journal = open(self.journal_file, 'a')
+            self._journal_seq += 1
+            self._journal.write(json.dumps({
+                "seq": self._journal_seq,
+                "api": api_name,
+                "success": success,
+                "date": self._today()
+            }) + "\n")
+            self._journal.flush()
+        except Exception as e:
+            logger.error(f"Error writing API usage journal: {str(e)}")
+    
+    def _truncate_journal(self):
+        """Empty the journal once its events are folded into the snapshot."""
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+        if self.journal_file.exists():
+            open(self.journal_file, 'w').close()
+    
+    def _replay_journal(self):
+        """Fold calls journaled after the last snapshot (e.g. before a crash) into the stats."""
+        if not self.journal_file.exists():
+            return
+        
+        with open(self.journal_file, 'r') as f:
+            lines = f.readlines()
+        
+        snapshot_seq = self._journal_seq
+        replayed = 0
+        for line in lines:
+            try:
+                event = json.loads(line)
+            except ValueError:
+                continue  # Partially written final line
+            # Calls up to the snapshot's marker are already counted in it (the
+            # journal wasn't emptied after the last save); entries without a
+            # sequence number predate the marker and are always replayed
+            seq = event.get("seq")
+            if seq is not None:
+                if seq <= snapshot_seq:
+                    continue
+                self._journal_seq = max(self._journal_seq, seq)
+            self._record_api_call(event["api"], event["success"], event.get("date"))
+            replayed += 1
+        
+        if replayed:
+            logger.info(f"Replayed {replayed} journaled API calls")
+            self._save_stats()
+        elif lines:
+            # Everything in the journal is already in the snapshot
+            self._truncate_journal()
+    
+    def _schedule_save(self):
+        """Mark stats dirty and write them once after SAVE_DELAY seconds."""
+        with self._lock:
+            self._dirty = True
+            if self._save_timer is None:
+                self._save_timer = threading.Timer(SAVE_DELAY, self.flush)
+                self._save_timer.daemon = True
+                self._save_timer.start()
+    
+    def flush(self):
+        """Write any pending statistics to disk immediately."""
+        with self._lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            if self._dirty:
+                self._save_stats()
+    
+    def _check_day_reset(self, api_name, save=True):
+        """Check if we need to reset the daily counter.
+        
+        Returns True if the counter was reset. Pass save=False when the caller
+        writes the stats itself after resetting several APIs.
+        """
+        today = self._today()
+        entry = self.usage_stats[api_name]
+        last_reset = entry["last_reset"]
         
         if today != last_reset:
             # It's a new day, store yesterday's count in history
-            yesterday = datetime.strptime(last_reset, "%Y-%m-%d").strftime("%Y-%m-%d")
-            yesterday_calls = self.usage_stats[api_name]["calls_today"]
-            
-            # Add to daily history
-            self.usage_stats[api_name]["daily_history"][yesterday] = yesterday_calls
-            
-            # Keep only the last 30 days in history
-            history = self.usage_stats[api_name]["daily_history"]
-            if len(history) > 30:
-                oldest_date = min(history.keys())
-                del history[oldest_date]
+            # (the deque drops days beyond HISTORY_DAYS)
+            entry["daily_history"].append([last_reset, entry["calls_today"]])
             
             # Reset counter for today
-            self.usage_stats[api_name]["calls_today"] = 0
-            self.usage_stats[api_name]["last_reset"] = today
-            self._save_stats()
+            entry["calls_today"] = 0
+            entry["last_reset"] = today
+            if save:
+                self._save_stats()
+            return True
+        return False
     
     def record_api_call(self, api_name, success=True):
         """Record an API call with its outcome."""
         api_name = api_name.lower()
-        if api_name not in self.usage_stats:
+        with self._lock:
+            self._record_api_call(api_name, success)
+            self._append_journal(api_name, success)
+        
+        # Fold the journal into the snapshot once this burst of calls is over
+        self._schedule_save()
+    
+    def _record_api_call(self, api_name, success, date=None):
+        """Update the in-memory counters for one API call made on date (default today)."""
+        entry = self.usage_stats.get(api_name)
+        if entry is None:
             # Initialize stats for new API
-            self.usage_stats[api_name] = {
-                "daily_limit": 1000,  # Default limit
-                "calls_today": 0,
-                "last_reset": datetime.now().strftime("%Y-%m-%d"),
-                "total_calls": 0,
-                "successful_calls": 0,
-                "failed_calls": 0,
-                "daily_history": {}
-            }
+            entry = self.usage_stats[api_name] = _default_api_stats(self._today())
         
-        # Check if day needs to be reset
-        self._check_day_reset(api_name)
+        # Check if day needs to be reset (saved along with this call)
+        self._check_day_reset(api_name, save=False)
         
         # Update stats
-        self.usage_stats[api_name]["calls_today"] += 1
-        self.usage_stats[api_name]["total_calls"] += 1
-        
-        if success:
-            self.usage_stats[api_name]["successful_calls"] += 1
+        if date is None or date == entry["last_reset"]:
+            entry["calls_today"] += 1
         else:
-            self.usage_stats[api_name]["failed_calls"] += 1
-        
-        # Save updated stats
-        self._save_stats()
+            # Replayed call from an earlier day
+            history = entry["daily_history"]
+            for day in history:
+                if day[0] == date:
+                    day[1] += 1
+                    break
+            else:
+                history.append([date, 1])
+        entry["total_calls"] += 1
+        entry["successful_calls" if success else "failed_calls"] += 1
     
     def set_api_limit(self, api_name, limit):
         """Set the daily limit for an API."""
-        api_name = api_name.lower()
-        if api_name in self.usage_stats:
-            self.usage_stats[api_name]["daily_limit"] = limit
-            self._save_stats()
+        with self._lock:
+            entry = self.usage_stats.get(api_name.lower())
+            if entry is not None:
+                entry["daily_limit"] = limit
+                self._save_stats()
+    
+    @staticmethod
+    def _copy_entry(entry):
+        """Return a copy of a stats entry that later calls won't change."""
+        return dict(entry, daily_history=list(entry["daily_history"]))
     
     def get_usage_stats(self, api_name=None):
-        """Get usage statistics for specific API or all APIs."""
-        if api_name:
-            api_name = api_name.lower()
-            if api_name in self.usage_stats:
+        """Get usage statistics for specific API or all APIs.
+        
+        Returns copies, so callers can read them while calls are being recorded.
+        """
+        with self._lock:
+            if api_name:
+                api_name = api_name.lower()
+                entry = self.usage_stats.get(api_name)
+                if entry is None:
+                    return None
                 # Check if day needs to be reset before returning stats
                 self._check_day_reset(api_name)
-                return self.usage_stats[api_name]
-            return None
-        
-        # Check all APIs for day reset
-        for api in self.usage_stats:
-            self._check_day_reset(api)
-        
-        return self.usage_stats
+                return self._copy_entry(entry)
+            
+            # Check all APIs for day reset, then save once for all of them
+            reset = False
+            for api in self.usage_stats:
+                if self._check_day_reset(api, save=False):
+                    reset = True
+            if reset:
+                self._save_stats()
+            
+            return {api: self._copy_entry(entry) for api, entry in self.usage_stats.items()}
     
     def get_usage_percentage(self, api_name):
         """Get the percentage of daily limit used."""
         api_name = api_name.lower()
-        if api_name in self.usage_stats:
-            self._check_day_reset(api_name)
-            limit = self.usage_stats[api_name]["daily_limit"]
-            used = self.usage_stats[api_name]["calls_today"]
-            
-            if limit > 0:
-                return (used / limit) * 100
+        with self._lock:
+            entry = self.usage_stats.get(api_name)
+            if entry is not None:
+                self._check_day_reset(api_name)
+                limit = entry["daily_limit"]
+                used = entry["calls_today"]
+                
+                if limit > 0:
+                    return (used / limit) * 100
         return 0
     
     def is_limit_reached(self, api_name):
         """Check if the daily limit has been reached."""
         api_name = api_name.lower()
-        if api_name in self.usage_stats:
-            self._check_day_reset(api_name)
-            limit = self.usage_stats[api_name]["daily_limit"]
-            used = self.usage_stats[api_name]["calls_today"]
-            
-            return used >= limit
+        with self._lock:
+            entry = self.usage_stats.get(api_name)
+            if entry is not None:
+                self._check_day_reset(api_name)
+                return entry["calls_today"] >= entry["daily_limit"]
         return False
     
     def get_history_data(self, api_name, days=7):
         """Get historical usage data for charts."""
         api_name = api_name.lower()
-        if api_name not in self.usage_stats:
-            return []
+        with self._lock:
+            if api_name not in self.usage_stats:
+                return []
             
-        history = self.usage_stats[api_name]["daily_history"]
+            entry = self.usage_stats[api_name]
+            history = dict(entry["daily_history"])
+            calls_today = entry["calls_today"]
         today = datetime.now().date()
         
-        # Include today's data
-        data = [{
-            "date": today.strftime("%Y-%m-%d"),
-            "calls": self.usage_stats[api_name]["calls_today"]
-        }]
-        
-        # Add historical data for the requested number of days
-        for i in range(1, days):
-            date = (today - timedelta(days=i)).strftime("%Y-%m-%d")
-            if date in history:
-                data.append({
-                    "date": date,
-                    "calls": history[date]
-                })
-            else:
-                data.append({
-                    "date": date,
-                    "calls": 0
-                })
+        # Historical data for the requested number of days, oldest first
+        dates = [(today - timedelta(days=i)).isoformat() for i in range(days - 1, 0, -1)]
+        data = [{"date": date, "calls": history.get(date, 0)} for date in dates]
         
-        # Sort by date
-        return sorted(data, key=lambda x: x["date"])
\ No newline at end of file
+        # Include today's data
+        data.append({
+            "date": today.isoformat(),
+            "calls": calls_today
+        })
+        return data
\ No newline at end of file
@@ -1,25 +1,65 @@
 # core/base_module.py
-from abc import ABC, abstractmethod
-from typing import Dict, Any, List
-from pathlib import Path  # Add this import
+from typing import Dict, Any, List, Protocol
+import logging
+import os
+import shutil
 import tkinter as tk
 from tkinter import ttk
 
-class BaseModule(ABC):
-    """Abstract base class for all modules.
+logger = logging.getLogger(__name__)
+
+# Buffer bounds for buffered copies; large media files get bigger buffers
+_COPY_BUFSIZE_MIN = 1 << 20
+_COPY_BUFSIZE_MAX = 16 << 20
+
+# Methods every module must override; checked by ModuleManager.register_module
+REQUIRED_METHODS = ('get_settings_widget', 'process_file', 'get_supported_extensions')
+
+
+class FileProcessor(Protocol):
+    """Structural type for anything that can be handed dropped files."""
+
+    def process_file(self, file_path: str, dest_path: str) -> bool: ...
+
+
+class BaseModule:
+    """Base class for all modules.
     
     This is like a template that defines what every module must be able to do.
     Think of it as a contract - if you want to create a module, you must implement
-    all these methods.
+    all the methods that raise NotImplementedError here.
     """
     
+    # Filter category shown on the Modules tab ("Files", "Media" or "Utilities");
+    # None lets the GUI work it out from the module name
+    category = None
+    
+    # Whether the main window should keep polling this module's queues while
+    # it doesn't have focus; modules with background jobs override this with a
+    # property that is True while a job runs
+    always_poll = False
+    
     def __init__(self, name: str, description: str):
         self.name = name  # e.g., "File Mover"
         self.description = description  # e.g., "Copy or move files with progress tracking"
-        self.enabled = True
+        self._enabled = True
+        self._enabled_callback = None  # Set by ModuleManager when registered
         self.config: Dict[str, Any] = {}
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the module is currently enabled."""
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, value: bool):
+        """Set the enabled state and notify the module manager if it changed."""
+        if value == self._enabled:
+            return
+        self._enabled = value
+        if self._enabled_callback is not None:
+            self._enabled_callback()
     
-    @abstractmethod
     def get_settings_widget(self, parent) -> ttk.Frame:
         """Return a widget containing module-specific settings.
         
@@ -28,26 +68,57 @@ class BaseModule(ABC):
         - Adds checkboxes for recursive copying
         - Adds a progress bar
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
-    def process_file(self, file_path: Path, dest_path: Path) -> bool:
+    def process_file(self, file_path: str, dest_path: str) -> bool:
         """Process a single file.
         
+        Paths are passed as plain strings; build a Path from them only where
+        the module actually needs one.
+        
         Example implementation in FileMoverModule:
         - Takes a file like "document.txt" and copies it to new location
         - Returns True if successful, False if failed
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def get_supported_extensions(self) -> List[str]:
         """Return list of supported file extensions.
         
         Example implementation in FileMoverModule:
         - Returns ['*'] because it can handle any file type
         """
-        pass
+        raise NotImplementedError
+
+    def _fast_copy(self, source, dest) -> None:
+        """Copy a file and its metadata, using a kernel-side copy where the OS supports it.
+        
+        Modules that copy files should use this instead of shutil.copy/copy2.
+        """
+        with open(source, 'rb') as src, open(dest, 'wb') as dst:
+            size = os.fstat(src.fileno()).st_size
+            copied = False
+            if hasattr(os, 'sendfile'):
+                try:
+                    offset = 0
+                    while offset < size:
+                        sent = os.sendfile(dst.fileno(), src.fileno(), offset, size - offset)
+                        if sent == 0:
+                            break
+                        offset += sent
+                    copied = True
+                except OSError as e:
+                    # e.g. sendfile not supported for this filesystem pair
+                    logger.debug(f"sendfile copy failed for {source}, falling back: {str(e)}")
+                    dst.seek(0)
+                    dst.truncate()
+
+            if not copied:
+                # Buffered copy sized to the file: fewer read/write calls for large media
+                bufsize = min(max(size // 16, _COPY_BUFSIZE_MIN), _COPY_BUFSIZE_MAX)
+                shutil.copyfileobj(src, dst, bufsize)
+
+        shutil.copystat(source, dest)
 
     def on_enable_changed(self, enabled: bool):
         """Handle module enable/disable state changes."""
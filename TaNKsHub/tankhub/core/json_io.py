@@ -0,0 +1,65 @@
+# core/json_io.py
+import json
+import mmap
+import os
+from functools import lru_cache
+
+try:
+    import orjson
+except ImportError:  # Optional C parser; the stdlib json module is used without it
+    orjson = None
+
+# Files at least this large are parsed straight from a memory map (orjson only)
+# instead of being read into, and held in, the text cache
+MMAP_MIN_SIZE = 64 * 1024
+
+
+@lru_cache(maxsize=16)
+def _read_text(path_str: str, mtime_ns: int, size: int) -> str:
+    """Return the file contents. Keyed on mtime/size so any write invalidates the entry."""
+    with open(path_str, 'r') as f:
+        return f.read()
+
+
+def read_json(path):
+    """Load a JSON file, skipping the disk read when the file hasn't changed.
+
+    Parsing still happens on every call so each caller gets its own objects
+    to mutate.
+    """
+    path_str = str(path)
+    st = os.stat(path_str)
+    if orjson is not None and st.st_size >= MMAP_MIN_SIZE:
+        with open(path_str, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as buf:
+                return orjson.loads(buf)
+    text = _read_text(path_str, st.st_mtime_ns, st.st_size)
+    return orjson.loads(text) if orjson is not None else json.loads(text)
+
+
+def write_json(path, data, indent=4, default=None):
+    """Write data as JSON via a temporary file so a crash never leaves a partial file.
+
+    default is passed to json.dump for objects it can't serialize natively.
+    Pass indent=None for files written often and rarely read by people; they are
+    written in compact form without the whitespace after separators.
+    """
+    path_str = str(path)
+    tmp_path = path_str + '.tmp'
+    separators = (',', ':') if indent is None else None
+    with open(tmp_path, 'w') as f:
+        if indent is None and orjson is not None:
+            f.write(orjson.dumps(data, default=default).decode())
+        else:
+            # orjson only indents by two spaces, so indented files keep using json
+            json.dump(data, f, indent=indent, separators=separators, default=default)
+    os.replace(tmp_path, path_str)
+
+
+def write_text(path, text):
+    """Write already-serialized text via a temporary file, like write_json."""
+    path_str = str(path)
+    tmp_path = path_str + '.tmp'
+    with open(tmp_path, 'w') as f:
+        f.write(text)
+    os.replace(tmp_path, path_str)
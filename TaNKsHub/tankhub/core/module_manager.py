@@ -1,8 +1,10 @@
-from typing import Dict, List
+from typing import Dict, List, Optional, Any, Tuple
 from pathlib import Path
+import atexit
 import json
 import logging
-from tankhub.core.base_module import BaseModule
+from tankhub.core.base_module import BaseModule, REQUIRED_METHODS
+from tankhub.core.json_io import read_json, write_text
 
 logger = logging.getLogger(__name__)
 
@@ -11,11 +13,20 @@ class ModuleManager:
     
     def __init__(self):
         self.modules: Dict[str, BaseModule] = {}
+        # All modules / enabled modules in registration order; None when they need rebuilding
+        self._all_cache: Optional[Tuple[BaseModule, ...]] = None
+        self._enabled_cache: Optional[List[BaseModule]] = None
         self.config_path = Path('config/module_config.json')
-        self._load_config()
+        # Set when modules change; written once by flush_config()
+        self._config_dirty = False
+        # JSON text last read from or written to disk, to skip no-op saves
+        self._config_text = None
+        # Saved per-module state, applied to each module when it registers
+        self._saved_config: Dict[str, Any] = self._read_config_file()
+        atexit.register(self.flush_config)
 
-    def _load_config(self) -> None:
-        """Load module configuration from file.
+    def _read_config_file(self) -> Dict[str, Any]:
+        """Read the saved module configuration from file.
         
         Example config.json:
         {
@@ -35,26 +46,34 @@ class ModuleManager:
             
             # Load existing config or create default
             if self.config_path.exists():
-                with open(self.config_path, 'r') as f:
-                    config = json.load(f)
-                    
-                # Apply config to each module
-                for module_name, settings in config.items():
-                    if module_name in self.modules:
-                        # Set module enabled state
-                        self.modules[module_name].enabled = settings.get('enabled', True)
-                        # Load module-specific settings
-                        if 'settings' in settings:
-                            self.modules[module_name].load_settings(settings['settings'])
-                            
+                config = read_json(self.config_path)
+                self._config_text = json.dumps(config, indent=4)
                 logger.info("Loaded module configuration")
-            else:
-                self._save_config()  # Create default config
-                logger.info("Created default module configuration")
+                return config
+            
+            self._save_config()  # Create default config
+            logger.info("Created default module configuration")
                 
         except Exception as e:
             logger.error(f"Error loading module configuration: {str(e)}")
             self._save_config()  # Create default config on error
+        
+        return {}
+
+    def _apply_config(self, module: BaseModule) -> None:
+        """Apply the saved configuration for a module as it is registered."""
+        settings = self._saved_config.get(module.name)
+        if not settings:
+            return
+        
+        try:
+            # Set module enabled state
+            module.enabled = settings.get('enabled', True)
+            # Load module-specific settings
+            if 'settings' in settings:
+                module.load_settings(settings['settings'])
+        except Exception as e:
+            logger.error(f"Error applying configuration to {module.name}: {str(e)}")
 
     def _save_config(self) -> None:
         """Save current module configuration to file."""
@@ -66,9 +85,17 @@ class ModuleManager:
                     'settings': module.save_settings()
                 }
                 
-            with open(self.config_path, 'w') as f:
-                json.dump(config, f, indent=4)
+            # Skip the write when the file already holds exactly this config
+            config_text = json.dumps(config, indent=4)
+            if config_text == self._config_text and self.config_path.exists():
+                self._config_dirty = False
+                logger.debug("Module configuration unchanged, not saving")
+                return
                 
+            write_text(self.config_path, config_text)
+            self._config_text = config_text
+                
+            self._config_dirty = False
             logger.info("Saved module configuration")
             
         except Exception as e:
@@ -76,14 +103,53 @@ class ModuleManager:
 
     def register_module(self, module: BaseModule) -> None:
         """Register a new module."""
+        missing = [name for name in REQUIRED_METHODS
+                   if getattr(type(module), name, None) in (None, getattr(BaseModule, name))]
+        if missing:
+            logger.error(f"Module {module.name} does not implement: {', '.join(missing)}")
+            return
+        
         self.modules[module.name] = module
+        module._enabled_callback = self._module_state_changed
+        self._all_cache = None
+        self._invalidate_enabled_cache()
+        self._apply_config(module)
         logger.debug(f"Registered module: {module.name}")
         logger.debug(f"Current modules: {list(self.modules.keys())}")
-        self._save_config()  # Update config with new module
+        self._config_dirty = True  # Saved by flush_config() once registration is done
+
+    def flush_config(self) -> None:
+        """Save the module configuration if it has changed since the last save."""
+        if self._config_dirty:
+            self._save_config()
+
+    def _module_state_changed(self) -> None:
+        """Called when a registered module is enabled or disabled."""
+        self._invalidate_enabled_cache()
+        self._config_dirty = True
+
+    def _invalidate_enabled_cache(self) -> None:
+        """Drop the cached enabled-module list after a module or its state changes."""
+        self._enabled_cache = None
+
+    def get_all_modules(self) -> Tuple[BaseModule, ...]:
+        """Return all registered modules, enabled or not.
+        
+        The tuple is rebuilt only when a module is registered, so it can be
+        shared between callers without copying.
+        """
+        if self._all_cache is None:
+            self._all_cache = tuple(self.modules.values())
+        return self._all_cache
 
     def get_enabled_modules(self) -> List[BaseModule]:
-        """Return list of enabled modules."""
-        enabled = [mod for mod in self.modules.values() if mod.enabled]
+        """Return list of enabled modules.
+        
+        The list is cached until a module is registered or enabled/disabled,
+        so callers should treat it as read-only.
+        """
+        if self._enabled_cache is None:
+            self._enabled_cache = [mod for mod in self.modules.values() if mod.enabled]
         #logger.debug(f"Getting enabled modules. Total modules: {len(self.modules)}")
-        #logger.debug(f"Enabled modules: {[m.name for m in enabled]}")
-        return enabled
\ No newline at end of file
+        #logger.debug(f"Enabled modules: {[m.name for m in self._enabled_cache]}")
+        return self._enabled_cache
\ No newline at end of file
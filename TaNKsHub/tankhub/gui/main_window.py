@@ -1,19 +1,78 @@
 import os
+import re
+import gc
+import heapq
 import json
+import time
 import logging
+import platform
+import queue
+import threading
+import traceback
+import weakref
+from datetime import datetime
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
-from tkinterdnd2 import DND_FILES, TkinterDnD
 from pathlib import Path
-from typing import Dict, List, Set
+from typing import Dict, Iterable, Iterator, List, Set, Tuple
 from tankhub.core.base_module import BaseModule
-
 from tankhub.core.module_manager import ModuleManager
-from tankhub.core.base_module import BaseModule
-from tankhub.modules.pdf_extractor import PDFExtractorModule
 
 logger = logging.getLogger(__name__)
 
+# Icon color shown next to each file in the file list, by extension
+FILE_TYPE_COLORS = {
+    '.mp4': 'red', '.mkv': 'red', '.avi': 'red', '.mov': 'red',  # Video files
+    '.jpg': 'green', '.png': 'green', '.gif': 'green',  # Image files
+    '.mp3': 'purple', '.wav': 'purple', '.flac': 'purple',  # Audio files
+}
+
+# One dropped path: a Tcl-braced path (may contain spaces) or a bare word
+_DND_PATH_RE = re.compile(r'\{([^}]*)\}|(\S+)')
+
+# Dropped paths sharing a parent folder with at least this many others are
+# checked with one os.scandir of the folder instead of a stat call each
+SCANDIR_GROUP_SIZE = 100
+
+# Quiet period after the last keystroke before the module search is applied
+FILTER_DELAY_MS = 150
+
+# How often the thread monitor looks for background tasks past their timeout
+THREAD_CHECK_INTERVAL_MS = 60000
+# Background tasks (e.g. large copies) running longer than this are reported as hung
+BACKGROUND_TASK_TIMEOUT = 600
+
+# Interpreter and OS shown on the dashboard; fixed for the life of the process
+SYSTEM_INFO = f"Python {platform.python_version()} on {platform.system()} {platform.release()}"
+
+# Minimum time between progress dialog updates posted by file processing workers
+PROGRESS_UPDATE_INTERVAL = 0.05
+# How often the Tk thread picks up those updates
+PROGRESS_POLL_MS = 50
+
+# Module queue polling interval with and without window focus; each poll that
+# finds no work doubles it, up to QUEUE_POLL_MAX_MS
+QUEUE_POLL_MS = 100
+QUEUE_POLL_UNFOCUSED_MS = 500
+QUEUE_POLL_MAX_MS = 2000
+
+
+def _module_category_tags(module):
+    """Return the module filter categories a module falls under."""
+    # A module can name its category; otherwise it is guessed from the name
+    category = getattr(module, 'category', None)
+    if category:
+        return frozenset((category,))
+    name = module.name
+    tags = set()
+    if "File" in name:
+        tags.add("Files")
+    if "Media" in name:
+        tags.add("Media")
+    return frozenset(tags or {"Utilities"})
+
 """
 Additional improvements for drag and drop functionality with detailed logging
 and better handling of edge cases.
@@ -35,82 +94,85 @@ class DragDropHandler:
         Returns:
             list: A list of parsed file paths.
         """
-        self.logger.debug(f"Raw drop data: {repr(data)}")
+        # Lazy %-formatting: the repr of a large drop is only built when DEBUG is on
+        self.logger.debug("Raw drop data: %r", data)
+        
+        cleaned_files = list(self._iter_dropped_paths(data))
+        self.logger.debug("Cleaned drop list: %d paths", len(cleaned_files))
         
+        # Process all file paths and folders
+        processed_files = self.process_paths(cleaned_files)
+        self.logger.debug("Final file list after processing folders: %d files", len(processed_files))
+        return processed_files
+    
+    def _iter_dropped_paths(self, data: str) -> Iterator[str]:
+        """Yield the cleaned paths in drag and drop data in a single pass."""
         # Different operating systems format drag-drop data differently
         # Windows: Paths with spaces are enclosed in curly braces
         # macOS: Paths are separated by newlines
         # Linux: Various formats depending on desktop environment
         
-        files = []
-        
-        # Check if this is a macOS-style drop (paths separated by newlines)
-        if '\n' in data and not (data.startswith('{') or '{' in data):
+        # macOS-style drop: one path per line, and paths may contain spaces
+        if '{' not in data and '\n' in data:
             self.logger.debug("Detected macOS-style drop (newline separated)")
-            files = [path.strip() for path in data.split('\n') if path.strip()]
-            
-        # Check if this is a simple list of space-separated paths (no braces)
-        elif ' ' in data and not ('{' in data or '}' in data):
-            self.logger.debug("Detected simple space-separated paths")
-            files = [path.strip() for path in data.split() if path.strip()]
+            paths = (line.strip() for line in data.split('\n'))
             
-        # Handle Windows-style drop (paths with spaces in curly braces)
+        # Otherwise a Tcl list: braced paths (Windows paths with spaces) and bare
+        # space-separated paths are both picked up by the same regex scan
         else:
-            self.logger.debug("Detected Windows-style drop (curly braces)")
-            
-            # If it's a single path in braces
-            if data.startswith('{') and data.endswith('}') and data.count('{') == 1:
-                self.logger.debug("Single path in braces")
-                files = [data.strip('{}')]
-                
-            # Multiple paths potentially with braces
-            else:
-                self.logger.debug("Multiple paths with potential braces")
-                current_file = ""
-                in_braces = False
-                
-                for char in data:
-                    if char == '{':
-                        in_braces = True
-                        # Don't include the brace in the path
-                    elif char == '}':
-                        in_braces = False
-                        if current_file:
-                            files.append(current_file)
-                            current_file = ""
-                    elif char.isspace() and not in_braces:
-                        if current_file:
-                            files.append(current_file)
-                            current_file = ""
-                    else:
-                        current_file += char
-                
-                # Add the last file if there is one
-                if current_file:
-                    files.append(current_file)
-        
-        # Log the parsed file list
-        self.logger.debug(f"Parsed {len(files)} dropped paths")
-        for i, file_path in enumerate(files):
-            self.logger.debug(f"  {i+1}: {file_path}")
+            self.logger.debug("Detected Tcl list drop (braced and/or space separated)")
+            paths = (match.group(1) or match.group(2) or '' for match in _DND_PATH_RE.finditer(data))
         
-        # Clean the paths (remove quotes, normalize slashes)
-        cleaned_files = []
-        for path in files:
-            # Remove potential quotes
+        # Only Windows drops contain backslashes; checking once spares the rest a replace per path
+        windows_separators = '\\' in data
+        for path in paths:
+            # Remove potential quotes and normalize path separators
             path = path.strip('"\'')
-            # Normalize path separators
-            path = path.replace('\\', '/')
+            if windows_separators:
+                path = path.replace('\\', '/')
             # Skip empty paths
             if path:
-                cleaned_files.append(path)
+                yield path
+    
+    def classify_paths(self, paths: List[str]) -> Dict[str, str]:
+        """
+        Work out whether each path is a file or a folder.
         
-        self.logger.debug(f"Cleaned drop list: {len(cleaned_files)} paths")
+        Args:
+            paths: List of file and folder paths
+            
+        Returns:
+            Dict mapping each path to 'file' or 'dir'; missing paths are left out
+        """
+        groups = defaultdict(list)
+        for path_str in paths:
+            groups[os.path.dirname(os.path.normpath(path_str))].append(path_str)
+        
+        kinds = {}
+        for parent, group in groups.items():
+            entries = None
+            if len(group) >= SCANDIR_GROUP_SIZE:
+                try:
+                    with os.scandir(parent or '.') as listing:
+                        entries = {os.path.normcase(entry.name): entry for entry in listing}
+                except OSError as e:
+                    self.logger.debug(f"Could not list {parent}, checking paths individually: {str(e)}")
+            
+            for path_str in group:
+                if entries is not None:
+                    entry = entries.get(os.path.normcase(os.path.basename(os.path.normpath(path_str))))
+                    is_dir = entry is not None and entry.is_dir()
+                    is_file = entry is not None and not is_dir and entry.is_file()
+                else:
+                    is_dir = os.path.isdir(path_str)
+                    is_file = not is_dir and os.path.isfile(path_str)
+                
+                if is_dir:
+                    kinds[path_str] = 'dir'
+                elif is_file:
+                    kinds[path_str] = 'file'
         
-        # Process all file paths and folders
-        processed_files = self.process_paths(cleaned_files)
-        self.logger.debug(f"Final file list after processing folders: {len(processed_files)} files")
-        return processed_files
+        return kinds
     
     def process_paths(self, paths: List[str]) -> List[str]:
         """
@@ -134,39 +196,48 @@ class DragDropHandler:
             '.mp3', '.wav', '.flac', '.aac', '.ogg'          # Audio
         }
         
+        # Check every path up front, listing shared folders once
+        kinds = self.classify_paths(paths)
+        
         # Process all paths
         for path_str in paths:
-            path = Path(path_str)
+            path = os.path.normpath(path_str)
             
-            # Skip already processed paths
-            if str(path.resolve()) in processed_paths:
+            # Skip already processed paths; an absolute, case-normalized path
+            # is enough here and, unlike resolve(), needs no filesystem calls
+            key = os.path.normcase(os.path.abspath(path))
+            if key in processed_paths:
                 self.logger.debug(f"Skipping already processed path: {path}")
                 continue
                 
-            processed_paths.add(str(path.resolve()))
+            processed_paths.add(key)
             
-            if not path.exists():
+            kind = kinds.get(path_str)
+            if kind is None:
                 self.logger.warning(f"Path does not exist: {path}")
                 continue
                 
-            if path.is_file():
+            if kind == 'file':
                 # Add individual file
-                result.append(str(path))
-                self.logger.debug(f"Added file: {path}")
-            elif path.is_dir():
+                result.append(path)
+            else:
                 # Process directory recursively
                 self.logger.debug(f"Processing directory: {path}")
                 file_count = 0
                 
                 for root, dirs, files in os.walk(path):
                     for file in files:
-                        file_path = Path(root) / file
-                        if file_path.suffix.lower() in supported_extensions:
-                            result.append(str(file_path))
+                        if os.path.splitext(file)[1].lower() in supported_extensions:
+                            result.append(os.path.join(root, file))
                             file_count += 1
                 
                 self.logger.debug(f"Found {file_count} valid files in directory: {path}")
         
+        # One log record for the whole drop, only built when debug logging is on
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Dropped files:\n" + "\n".join(
+                f"  {i}: {file_path}" for i, file_path in enumerate(result, 1)))
+        
         return result
 
 class ThreadMonitor:
@@ -174,71 +245,116 @@ class ThreadMonitor:
     
     def __init__(self, app):
         self.app = app
+        # Running threads only; entries are removed as soon as a thread finishes
         self.monitored_threads = {}
+        # (deadline, thread_id) min-heap; entries for finished threads are skipped when popped
+        self._deadlines = []
         self.logger = logging.getLogger(__name__)
     
     def register_thread(self, thread, name, timeout_seconds=60):
         """Register a thread to be monitored."""
         thread_id = id(thread)
+        start_time = time.time()
+        deadline = start_time + timeout_seconds
         self.monitored_threads[thread_id] = {
             'thread': thread,
             'name': name,
-            'start_time': time.time(),
+            'start_time': start_time,
             'timeout': timeout_seconds,
-            'completed': False
+            'deadline': deadline
         }
+        heapq.heappush(self._deadlines, (deadline, thread_id))
         self.logger.debug(f"Registered thread: {name} with ID {thread_id}")
         return thread_id
     
     def mark_completed(self, thread_id):
-        """Mark a thread as completed."""
-        if thread_id in self.monitored_threads:
-            self.monitored_threads[thread_id]['completed'] = True
-            self.logger.debug(f"Thread {self.monitored_threads[thread_id]['name']} marked as completed")
+        """Stop monitoring a thread once it has finished."""
+        info = self.monitored_threads.pop(thread_id, None)
+        if info is not None:
+            self.logger.debug(f"Thread {info['name']} marked as completed")
     
     def check_threads(self):
-        """Check monitored threads for timeouts."""
-        import time
+        """Warn about monitored threads that have run past their timeout.
+        
+        Finished threads report themselves through mark_completed(), so this
+        only has to look for hung ones and can run infrequently.
+        """
         current_time = time.time()
         
-        for thread_id, info in list(self.monitored_threads.items()):
-            # Skip completed threads
-            if info['completed']:
-                # Clean up old completed threads
-                if current_time - info['start_time'] > 300:  # 5 minutes
-                    del self.monitored_threads[thread_id]
+        # Only threads whose deadline has passed are looked at
+        while self._deadlines and self._deadlines[0][0] <= current_time:
+            deadline, thread_id = heapq.heappop(self._deadlines)
+            info = self.monitored_threads.get(thread_id)
+            # Already completed, or the id now belongs to a newer thread
+            if info is None or info['deadline'] != deadline:
                 continue
+            elapsed = current_time - info['start_time']
             
-            # Check if thread is still alive
+            # Finished without reporting back (e.g. a thread not started by run_in_background)
             if not info['thread'].is_alive():
                 self.logger.debug(f"Thread {info['name']} completed normally")
-                self.monitored_threads[thread_id]['completed'] = True
+                del self.monitored_threads[thread_id]
                 continue
             
-            # Check for timeout
-            elapsed = current_time - info['start_time']
-            if elapsed > info['timeout']:
-                self.logger.warning(f"Thread {info['name']} appears to be hung (running for {elapsed:.1f}s)")
-                # We can't force-terminate threads in Python, but we can notify the user
-                if hasattr(self.app, 'root'):
-                    self.app.root.after(0, lambda n=info['name']: messagebox.showwarning(
-                        "Warning",
-                        f"A background task ({n}) is taking longer than expected.\n"
-                        "You may want to restart the application if this persists."
-                    ))
-                # Mark as completed to prevent repeated warnings
-                self.monitored_threads[thread_id]['completed'] = True
+            self.logger.warning(f"Thread {info['name']} appears to be hung (running for {elapsed:.1f}s)")
+            # We can't force-terminate threads in Python, but we can notify the user
+            if hasattr(self.app, 'root'):
+                self.app.root.after(0, lambda n=info['name']: messagebox.showwarning(
+                    "Warning",
+                    f"A background task ({n}) is taking longer than expected.\n"
+                    "You may want to restart the application if this persists."
+                ))
+            # Stop monitoring it to prevent repeated warnings
+            del self.monitored_threads[thread_id]
         
         # Schedule next check
         if hasattr(self.app, 'root'):
-            self.app.root.after(10000, self.check_threads)  # Check every 10 seconds
+            self.app.root.after(THREAD_CHECK_INTERVAL_MS, self.check_threads)
 
 class TaNKsHubGUI:
+    # Fixed combobox choices
+    _LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+    _THEMES = ("default", "light", "dark")
+    _MODULE_CATEGORIES = ("All", "Files", "Media", "Utilities")
+    # Placeholder stats line shown on a module's dashboard card
+    _MODULE_CARD_STATS = {
+        "File Mover": "Files processed: 0",
+        "File Name Editor": "Files renamed: 0",
+        "Media Sorter": "Files analyzed: 0",
+    }
+    # Placeholder icons by (colour, size), shared by every window in the process
+    _icon_cache: Dict[tuple, tk.PhotoImage] = {}
+
     def __init__(self, root):
         self.root = root
         self.root.title("TaNKsHub")
         self.module_manager = ModuleManager()
         self.active_modules: Dict[str, ttk.Frame] = {}
+        # Module tabs are built once and re-added when the notebook is refreshed
+        self.module_tabs: Dict[str, ttk.Frame] = {}
+        # Module tabs still waiting for their content, keyed by Tk widget path
+        self._unbuilt_module_tabs: Dict[str, BaseModule] = {}
+        # Module name for each module tab, keyed by Tk widget path
+        self._module_tab_names: Dict[str, str] = {}
+        # Modules whose tab is in the notebook but hidden by the search filter
+        self._hidden_module_tabs: Set[str] = set()
+        self.module_enabled_vars: Dict[str, tk.BooleanVar] = {}
+        # Pending after() id for a search-box filter, so typing rebuilds the tabs once
+        self._filter_after_id = None
+        # Module name -> (lower-case name, lower-case description, category tags)
+        self._module_search_index: Dict[str, tuple] = {}
+        # Module search/filter state, bound to widgets in create_module_filter()
+        self.search_var = tk.StringVar()
+        self.category_var = tk.StringVar(value="All")
+        self._no_match_tab = None  # "No Matches" placeholder, created on first use
+        self.drop_handler = DragDropHandler(logger)
+        # Tooltip text by widget path; widgets given a tooltip share one set of class bindings
+        self._tooltip_texts: Dict[str, str] = {}
+        self.tooltip = None  # Tooltip window, created on first hover and then reused
+        self._tooltip_label = None
+        self.root.bind_class('Tooltip', '<Enter>', self._show_tooltip)
+        self.root.bind_class('Tooltip', '<Leave>', self._hide_tooltip)
+        self.root.bind_class('Tooltip', '<Destroy>', lambda e: self._tooltip_texts.pop(str(e.widget), None))
         
         self.initialize_thread_monitor()
         self.logger = logging.getLogger(__name__)
@@ -252,15 +368,43 @@ class TaNKsHubGUI:
         
         # Initialize shared file paths list before setting up GUI
         self.file_paths = []  # Store current file paths
+        self._file_set: Set[str] = set()  # Keys of file_paths, for duplicate checks
+        # (folder, name, lower-case extension) for each path in file_paths
+        self._file_info_cache: Dict[str, Tuple[str, str, str]] = {}
+        # Files added since the file list was last drawn, flushed when idle
+        self._pending_files = []
+        self._flush_scheduled = False
+        # Raw drop data not yet parsed; successive drops are handled together
+        self._pending_drops = []
+        
+        # Worker pool for handing dropped files to modules
+        self.file_pool = ThreadPoolExecutor(
+            max_workers=min(32, (os.cpu_count() or 4) * 2),
+            thread_name_prefix="process_files"
+        )
+        
+        # The dashboard is only rebuilt when it is shown and something changed
+        self._dashboard_dirty = True
+        self._dashboard_check_scheduled = False
+        # Frames holding each dashboard panel, created on the first build
+        self._dashboard_slots = None
+        # API stats the API usage panel was last built from
+        self._api_panel_stats = None
+        # Modules the dashboard module cards were built for, and each card's
+        # changing widgets by module name
+        self._module_cards_for = None
+        self._module_card_widgets: Dict[str, Dict[str, tk.Widget]] = {}
+        
+        # Consecutive queue polls that found no work, for backing off
+        self._poll_idle_streak = 0
         
         self.setup_gui()
         self.process_queues()
         
     def initialize_thread_monitor(self):
         """Initialize the thread monitor."""
-        import time
         self.thread_monitor = ThreadMonitor(self)
-        self.root.after(10000, self.thread_monitor.check_threads)  # Start checking after 10 seconds
+        self.root.after(THREAD_CHECK_INTERVAL_MS, self.thread_monitor.check_threads)
 
     def configure_styles(self):
         """Configure ttk styles for the application."""
@@ -294,13 +438,21 @@ class TaNKsHubGUI:
             # Create an empty default icon
             self.module_icons["default"] = self.create_colored_icon("gray", (16, 16))
             
-    def create_colored_icon(self, color, size):
+    @classmethod
+    def create_colored_icon(cls, color, size):
         """Create a simple colored square icon as a placeholder.
-        In a real application, you'd load actual image files."""
-        icon = tk.PhotoImage(width=size[0], height=size[1])
-        for x in range(size[0]):
-            for y in range(size[1]):
-                icon.put(color, (x, y))
+        In a real application, you'd load actual image files.
+        
+        Icons are cached, so each colour and size is only drawn once per process.
+        The cache also keeps the images alive, so labels don't need their own reference.
+        """
+        key = (color, tuple(size))
+        icon = cls._icon_cache.get(key)
+        if icon is None:
+            icon = tk.PhotoImage(width=size[0], height=size[1])
+            # One put that tiles the colour over the whole image, not one Tcl call per pixel
+            icon.put(color, to=(0, 0, size[0], size[1]))
+            cls._icon_cache[key] = icon
         return icon
 
     def run_in_background(self, task_func, callback=None, *args, **kwargs):
@@ -312,7 +464,6 @@ class TaNKsHubGUI:
             callback: Optional function to call when task completes
             *args, **kwargs: Arguments to pass to task_func
         """
-        import threading
     
         def _thread_task():
             result = None
@@ -320,14 +471,17 @@ class TaNKsHubGUI:
                 result = task_func(*args, **kwargs)
             except Exception as e:
                 logger.error(f"Error in background task: {str(e)}")
-                import traceback
                 logger.error(traceback.format_exc())
         
             # Call the callback in the main thread if provided
             if callback:
                 self.root.after(0, lambda: callback(result))
+            # Tell the monitor this thread is done, so it never has to poll for it
+            self.root.after(0, self.thread_monitor.mark_completed, thread_id)
     
         thread = threading.Thread(target=_thread_task, daemon=True)
+        thread_id = self.thread_monitor.register_thread(
+            thread, getattr(task_func, '__name__', 'background task'), BACKGROUND_TASK_TIMEOUT)
         thread.start()
         return thread
 
@@ -351,6 +505,7 @@ class TaNKsHubGUI:
         
         # Pack the modules notebook below the search area
         self.modules_notebook.pack(expand=True, fill='both', padx=5, pady=5)
+        self.modules_notebook.bind('<<NotebookTabChanged>>', self.on_module_tab_changed)
         
         self.settings_tab = ttk.Frame(self.notebook)
         
@@ -358,151 +513,13 @@ class TaNKsHubGUI:
         self.notebook.add(self.files_tab, text='Files')
         self.notebook.add(self.modules_frame, text='Modules')
         self.notebook.add(self.settings_tab, text='Settings')
+        # The dashboard is built when it is first selected, once modules are registered
+        self.notebook.bind('<<NotebookTabChanged>>', self.on_main_tab_changed)
         
-        self.setup_dashboard_tab()
         self.setup_files_tab()
         self.setup_modules_tab()
         self.setup_settings_tab()
         
-    def setup_dashboard_tab(self):
-        """Set up the dashboard tab with module summaries and status."""
-        # Clear existing content
-        for widget in self.dashboard_tab.winfo_children():
-            widget.destroy()
-            
-        # Create a welcome header
-        header_frame = ttk.Frame(self.dashboard_tab)
-        header_frame.pack(fill='x', padx=10, pady=10)
-        
-        ttk.Label(
-            header_frame,
-            text="TaNKsHub Dashboard",
-            font=("", 16, "bold")
-        ).pack(side='left')
-        
-        # Add refresh button
-        ttk.Button(
-            header_frame,
-            text="Refresh",
-            command=self.setup_dashboard_tab
-        ).pack(side='right')
-        
-        # Display system info
-        info_frame = ttk.LabelFrame(self.dashboard_tab, text="System Info", padding=10)
-        info_frame.pack(fill='x', padx=10, pady=5)
-        
-        import platform
-        system_info = f"Python {platform.python_version()} on {platform.system()} {platform.release()}"
-        
-        ttk.Label(
-            info_frame,
-            text=system_info
-        ).pack(anchor='w')
-        # Files section
-        files_frame = ttk.LabelFrame(self.dashboard_tab, text="Files", padding=10)
-        files_frame.pack(fill='x', padx=10, pady=5)
-        
-        file_count = len(self.file_paths)
-        ttk.Label(
-            files_frame,
-            text=f"Currently loaded: {file_count} files"
-        ).pack(anchor='w')
-        
-        if file_count > 0:
-            # Display first few files
-            max_display = min(5, file_count)
-            for i in range(max_display):
-                ttk.Label(
-                    files_frame,
-                    text=f"• {os.path.basename(self.file_paths[i])}"
-                ).pack(anchor='w', padx=10)
-                
-            if file_count > max_display:
-                ttk.Label(
-                    files_frame,
-                    text=f"... and {file_count - max_display} more"
-                ).pack(anchor='w', padx=10)
-        else:
-            ttk.Label(
-                files_frame,
-                text="No files loaded. Drag and drop files or click the Files tab to add some."
-            ).pack(anchor='w', padx=10)
-
-        # Module summary section
-        modules_frame = ttk.LabelFrame(self.dashboard_tab, text="Modules", padding=10)
-        modules_frame.pack(fill='both', expand=True, padx=10, pady=5)
-        
-        # Create a canvas with scrollbar for module cards
-        canvas_frame = ttk.Frame(modules_frame)
-        canvas_frame.pack(fill='both', expand=True)
-        
-        canvas = tk.Canvas(canvas_frame)
-        scrollbar = ttk.Scrollbar(canvas_frame, orient="vertical", command=canvas.yview)
-        
-        # Configure canvas
-        canvas.configure(yscrollcommand=scrollbar.set)
-        canvas.pack(side='left', fill='both', expand=True)
-        scrollbar.pack(side='right', fill='y')
-        
-        # Frame inside canvas for module cards
-        module_cards_frame = ttk.Frame(canvas)
-        canvas.create_window((0, 0), window=module_cards_frame, anchor='nw')
-        
-        # Add module cards
-        self.create_module_summary_cards(module_cards_frame)
-        
-        # Update canvas scroll region when module_cards_frame changes size
-        module_cards_frame.bind('<Configure>', lambda e: canvas.configure(scrollregion=canvas.bbox('all')))
-        
-    def create_module_summary_cards(self, parent):
-        """Create summary cards for each module."""
-        # Get all modules
-        all_modules = list(self.module_manager.modules.values())
-        enabled_count = len([m for m in all_modules if m.enabled])
-        
-        # Show enabled count
-        ttk.Label(
-            parent,
-            text=f"Enabled: {enabled_count}/{len(all_modules)} modules",
-            font=("", 10, "bold")
-        ).pack(anchor='w', padx=5, pady=5)
-        
-        # Create a card for each module
-        for module in all_modules:
-            card_frame = ttk.Frame(parent, relief="solid", borderwidth=1)
-            card_frame.pack(fill='x', padx=5, pady=5, ipadx=5, ipady=5)
-            
-            # Add module name and status
-            header_frame = ttk.Frame(card_frame)
-            header_frame.pack(fill='x', padx=5, pady=5)
-            
-            # Get the appropriate icon
-            icon = self.module_icons.get(module.name, self.module_icons.get("default"))
-            icon_label = ttk.Label(header_frame, image=icon)
-            icon_label.pack(side='left', padx=5)
-            
-            title_frame = ttk.Frame(header_frame)
-            title_frame.pack(side='left', fill='x', expand=True)
-            
-            ttk.Label(
-                title_frame,
-                text=module.name,
-                font=("", 11, "bold")
-            ).pack(anchor='w')
-            
-            ttk.Label(
-                title_frame,
-                text=module.description,
-                font=("", 9, "italic")
-            ).pack(anchor='w')
-            
-            # Status indicator - green for enabled, red for disabled
-            status_color = "green" if module.enabled else "red"
-            status_text = "Enabled" if module.enabled else "Disabled"
-            
-            status_frame = ttk.Frame(header_frame)
-            status_frame.pack(side='right', padx=5)          
-        
     def create_module_filter(self, parent):
         """Create a search/filter area for modules."""
         filter_frame = ttk.Frame(parent)
@@ -510,20 +527,18 @@ class TaNKsHubGUI:
         
         # Search entry
         ttk.Label(filter_frame, text="Search Modules:").pack(side='left', padx=5)
-        self.search_var = tk.StringVar()
         search_entry = ttk.Entry(filter_frame, textvariable=self.search_var, width=30)
         search_entry.pack(side='left', padx=5)
         
         # Bind search entry to filter function
-        self.search_var.trace_add('write', self.filter_modules)
+        self.search_var.trace_add('write', self.schedule_filter_modules)
         
         # Category filter
         ttk.Label(filter_frame, text="Category:").pack(side='left', padx=5)
-        self.category_var = tk.StringVar(value="All")
         category_combo = ttk.Combobox(
             filter_frame,
             textvariable=self.category_var,
-            values=["All", "Files", "Media", "Utilities"],
+            values=self._MODULE_CATEGORIES,
             width=15
         )
         category_combo.pack(side='left', padx=5)
@@ -538,76 +553,102 @@ class TaNKsHubGUI:
             command=self.reset_filters
         ).pack(side='right', padx=5)
         
+    def schedule_filter_modules(self, *args):
+        """Filter modules once the user pauses typing in the search box."""
+        self.cancel_pending_filter()
+        self._filter_after_id = self.root.after(FILTER_DELAY_MS, self.filter_modules)
+
+    def cancel_pending_filter(self):
+        """Drop a scheduled search-box filter, if any."""
+        if self._filter_after_id is not None:
+            self.root.after_cancel(self._filter_after_id)
+            self._filter_after_id = None
+
+    def get_module_search_info(self, module):
+        """Return the module's search fields, computed once per module."""
+        info = self._module_search_index.get(module.name)
+        if info is None:
+            info = (module.name.lower(), module.description.lower(), _module_category_tags(module))
+            self._module_search_index[module.name] = info
+        return info
+
     def filter_modules(self, *args):
         """Filter modules based on search text and category."""
+        self.cancel_pending_filter()
         search_text = self.search_var.get().lower()
         category = self.category_var.get()
         
         # Get all modules (enabled or not)
-        all_modules = list(self.module_manager.modules.values())
+        all_modules = self.module_manager.get_all_modules()
         
         # Store current tab selection
         current_tab = self.modules_notebook.select()
-        
-        # Clear existing tabs
-        for tab in self.modules_notebook.tabs():
-            self.modules_notebook.forget(tab)
+        notebook_tabs = set(self.modules_notebook.tabs())
         
         # Track if we found any matches
         found_modules = False
+        visible_tabs = []
         
-        # Rebuild tabs with filter applied
+        # Show matching tabs and hide the rest; tabs stay in the notebook
         for module in all_modules:
+            name_lc, desc_lc, tags = self.get_module_search_info(module)
+            
             # Check if module matches search text
-            name_match = search_text in module.name.lower()
-            desc_match = search_text in module.description.lower()
+            name_match = search_text in name_lc
+            desc_match = search_text in desc_lc
             
             # Check if module matches category
-            # In a real app, you would have a category attribute on each module
-            category_match = (category == "All" or 
-                             (category == "Files" and "File" in module.name) or
-                             (category == "Media" and "Media" in module.name) or
-                             (category == "Utilities" and not ("File" in module.name or "Media" in module.name)))
+            category_match = category == "All" or category in tags
+            matches = (name_match or desc_match) and category_match
+            found_modules = found_modules or matches
             
-            if (name_match or desc_match) and category_match:
-                found_modules = True
-                
-                # Create a tab for this module
-                module_tab = ttk.Frame(self.modules_notebook, padding=5)
-                
-                # Get the appropriate icon
+            # Get the tab for this module, adding it if it isn't in the notebook yet
+            module_tab = self.get_module_tab(module)
+            if str(module_tab) not in notebook_tabs:
+                if not matches:
+                    continue
                 icon = self.module_icons.get(module.name, self.module_icons.get("default"))
-                
-                # Add the tab
-                self.modules_notebook.add(
-                    module_tab, 
-                    text=module.name,
-                    image=icon,
-                    compound=tk.LEFT
-                )
-                
-                # Set up the tab content
-                self.setup_module_tab_content(module_tab, module)
-                
+                self.modules_notebook.add(module_tab, text=module.name, image=icon, compound=tk.LEFT)
                 # Store reference to module's frame
                 self.active_modules[module.name] = module_tab
+            elif matches == (module.name in self._hidden_module_tabs):
+                # Only tabs whose visibility changes are touched
+                self.modules_notebook.tab(module_tab, state='normal' if matches else 'hidden')
+                if matches:
+                    self._hidden_module_tabs.discard(module.name)
+                else:
+                    self._hidden_module_tabs.add(module.name)
+            
+            if matches:
+                visible_tabs.append(str(module_tab))
         
         # If no modules match, show a message
-        if not found_modules:
-            no_match_tab = ttk.Frame(self.modules_notebook)
-            self.modules_notebook.add(no_match_tab, text="No Matches")
-            
+        no_match_tab = self.get_no_match_tab()
+        show_no_match = not found_modules and bool(all_modules)
+        self.modules_notebook.tab(no_match_tab, state='normal' if show_no_match else 'hidden')
+        if show_no_match:
+            visible_tabs.append(str(no_match_tab))
+        
+        # Try to restore the previous tab selection or select the first visible tab
+        if current_tab in visible_tabs:
+            self.modules_notebook.select(current_tab)
+        elif visible_tabs:
+            self.modules_notebook.select(visible_tabs[0])
+        self.on_module_tab_changed()
+
+    def get_no_match_tab(self):
+        """Return the "No Matches" placeholder tab, adding it to the notebook if needed."""
+        tab = self._no_match_tab
+        if tab is None or not tab.winfo_exists():
+            tab = ttk.Frame(self.modules_notebook)
             ttk.Label(
-                no_match_tab,
+                tab,
                 text="No modules match your search criteria",
                 padding=20
             ).pack(expand=True)
-        
-        # Try to restore the previous tab selection or select the first tab
-        if current_tab and current_tab in self.modules_notebook.tabs():
-            self.modules_notebook.select(current_tab)
-        elif self.modules_notebook.tabs():
-            self.modules_notebook.select(0)
+            self.modules_notebook.add(tab, text="No Matches", state='hidden')
+            self._no_match_tab = tab
+        return tab
     
     def reset_filters(self):
         """Reset search filters and show all modules."""
@@ -615,6 +656,36 @@ class TaNKsHubGUI:
         self.category_var.set("All")
         self.setup_modules_tab()  # Rebuild all tabs
         
+    def clear_module_tabs(self):
+        """Remove all tabs from the modules notebook, keeping module tabs for reuse."""
+        cached_tabs = {str(tab) for tab in self.module_tabs.values()}
+        self._hidden_module_tabs.clear()
+        for tab in self.modules_notebook.tabs():
+            self.modules_notebook.forget(tab)
+            # Placeholder tabs ("No Modules"/"No Matches") are rebuilt when needed
+            if tab not in cached_tabs:
+                self.modules_notebook.nametowidget(tab).destroy()
+
+    def get_module_tab(self, module):
+        """Return the module's tab frame; its content is built when the tab is first shown."""
+        module_tab = self.module_tabs.get(module.name)
+        if module_tab is None:
+            module_tab = ttk.Frame(self.modules_notebook, padding=5)
+            self.module_tabs[module.name] = module_tab
+            self._unbuilt_module_tabs[str(module_tab)] = module
+            self._module_tab_names[str(module_tab)] = module.name
+        elif module.name in self.module_enabled_vars:
+            # The module may have been enabled/disabled from the dashboard meanwhile
+            self.module_enabled_vars[module.name].set(module.enabled)
+        return module_tab
+
+    def on_module_tab_changed(self, event=None):
+        """Build the selected module tab's content the first time it is shown."""
+        tab = self.modules_notebook.select()
+        module = self._unbuilt_module_tabs.pop(tab, None)
+        if module is not None:
+            self.setup_module_tab_content(self.modules_notebook.nametowidget(tab), module)
+
     def setup_module_tab_content(self, tab_frame, module):
         """Set up the content for a module tab."""
         # Module info and enable/disable control
@@ -630,6 +701,7 @@ class TaNKsHubGUI:
         
         # Enable/disable checkbox
         enabled_var = tk.BooleanVar(value=module.enabled)
+        self.module_enabled_vars[module.name] = enabled_var
         ttk.Checkbutton(
             header_frame,
             text="Enabled",
@@ -642,11 +714,16 @@ class TaNKsHubGUI:
         if settings_widget:
             settings_widget.pack(fill='both', expand=True, padx=5, pady=5)
 
+    def _mk_frame(self, parent, text, padding=5, fill='x', expand=False):
+        """Create and pack a titled section frame with the standard spacing."""
+        frame = ttk.LabelFrame(parent, text=text, padding=padding)
+        frame.pack(fill=fill, expand=expand, padx=5, pady=5)
+        return frame
+
     def setup_files_tab(self):
         """Set up the files management interface with improved controls."""
         # Drop zone frame
-        self.drop_frame = ttk.LabelFrame(self.files_tab, text="Drop Files", padding=10)
-        self.drop_frame.pack(fill='x', padx=5, pady=5)
+        self.drop_frame = self._mk_frame(self.files_tab, "Drop Files", padding=10)
     
         self.drop_label = ttk.Label(
             self.drop_frame,
@@ -656,6 +733,8 @@ class TaNKsHubGUI:
         self.drop_label.pack(expand=True)
     
         # Configure drag and drop for both frame and label
+        # (tkinterdnd2 is only needed once the files tab is built)
+        from tkinterdnd2 import DND_FILES
         self.drop_frame.drop_target_register(DND_FILES)
         self.drop_label.drop_target_register(DND_FILES)
     
@@ -668,8 +747,7 @@ class TaNKsHubGUI:
         self.drop_label.bind("<Button-1>", self.select_files)
     
         # Add a file list display with improved UI
-        self.file_list_frame = ttk.LabelFrame(self.files_tab, text="Selected Files", padding=5)
-        self.file_list_frame.pack(fill='both', expand=True, padx=5, pady=5)
+        self.file_list_frame = self._mk_frame(self.files_tab, "Selected Files", fill='both', expand=True)
     
         # Add buttons for file list actions
         self.file_list_actions_frame = ttk.Frame(self.file_list_frame)
@@ -693,6 +771,38 @@ class TaNKsHubGUI:
             command=self.select_files
         ).pack(side='right', padx=5)
     
+        # Remove selected button
+        ttk.Button(
+            self.file_list_actions_frame,
+            text="Remove Selected",
+            command=self.remove_selected_files
+        ).pack(side='right', padx=5)
+    
+        # File list: a Treeview only draws the visible rows, so large drops stay responsive
+        list_container = ttk.Frame(self.file_list_frame)
+        list_container.pack(fill='both', expand=True, padx=5, pady=5)
+    
+        scrollbar = ttk.Scrollbar(list_container)
+        scrollbar.pack(side='right', fill='y')
+    
+        self.file_tree = ttk.Treeview(
+            list_container,
+            columns=("folder",),
+            show="tree headings",
+            yscrollcommand=scrollbar.set
+        )
+        self.file_tree.heading("#0", text="File", anchor='w')
+        self.file_tree.heading("folder", text="Location", anchor='w')
+        self.file_tree.pack(side='left', fill='both', expand=True)
+        scrollbar.config(command=self.file_tree.yview)
+        self.file_tree.bind("<Delete>", lambda e: self.remove_selected_files())
+    
+        # One icon per file type, shared by every row
+        self.file_type_icons = {
+            color: self.create_colored_icon(color, (12, 12))
+            for color in {"blue", *FILE_TYPE_COLORS.values()}
+        }
+    
         # Initialize with empty list
         self.update_file_list_display([])
 
@@ -701,26 +811,25 @@ class TaNKsHubGUI:
         logger.debug("Setting up modules tab")
     
         # Reset filters to ensure all modules are shown
-        if hasattr(self, 'search_var'):
-            self.search_var.set("")
-        if hasattr(self, 'category_var'):
-            self.category_var.set("All")
+        self.search_var.set("")
+        self.category_var.set("All")
+        # All tabs are rebuilt below, so the filter queued by the reset isn't needed
+        self.cancel_pending_filter()
     
         # Clear existing tabs in the modules notebook
-        for tab in self.modules_notebook.tabs():
-            self.modules_notebook.forget(tab)
+        self.clear_module_tabs()
         self.active_modules.clear()
     
         # Get all modules - we'll show all but highlight enabled ones
-        all_modules = list(self.module_manager.modules.values())
+        all_modules = self.module_manager.get_all_modules()
         logger.debug(f"Found {len(all_modules)} total modules")
     
         # Create a tab for each module
         for module in all_modules:
             logger.debug(f"Creating tab for module: {module.name}")
             
-            # Create a frame for this module's tab
-            module_tab = ttk.Frame(self.modules_notebook, padding=5)
+            # Get the frame for this module's tab (built on first use)
+            module_tab = self.get_module_tab(module)
             
             # Get the appropriate icon for this module
             icon = self.module_icons.get(module.name, self.module_icons.get("default"))
@@ -728,9 +837,6 @@ class TaNKsHubGUI:
             # Add the tab with icon and text
             self.modules_notebook.add(module_tab, text=module.name, image=icon, compound=tk.LEFT)
             
-            # Set up the content for this module's tab
-            self.setup_module_tab_content(module_tab, module)
-            
             # Store reference to module's frame
             self.active_modules[module.name] = module_tab
             logger.debug(f"Successfully created tab for {module.name}")
@@ -753,15 +859,13 @@ class TaNKsHubGUI:
                 text="No modules currently available",
                 padding=20
             ).pack(expand=True)
+    
+        # Build the content of whichever tab the notebook selected
+        self.on_module_tab_changed()
 
     def add_memory_management_to_settings(self):
         """Add memory management to settings tab."""
-        memory_frame = ttk.LabelFrame(
-            self.settings_tab,
-            text="Memory Management",
-            padding=5
-        )
-        memory_frame.pack(fill='x', padx=5, pady=5)
+        memory_frame = self._mk_frame(self.settings_tab, "Memory Management")
     
         ttk.Button(
             memory_frame,
@@ -772,12 +876,7 @@ class TaNKsHubGUI:
     def setup_settings_tab(self):
         """Set up the application settings interface."""
         # General settings
-        self.general_settings_frame = ttk.LabelFrame(
-            self.settings_tab,
-            text="General Settings",
-            padding=5
-        )
-        self.general_settings_frame.pack(fill='x', padx=5, pady=5)
+        self.general_settings_frame = self._mk_frame(self.settings_tab, "General Settings")
         
         # Theme selection
         ttk.Label(self.general_settings_frame, text="Theme:").pack(anchor='w', padx=5, pady=2)
@@ -785,17 +884,12 @@ class TaNKsHubGUI:
         theme_combo = ttk.Combobox(
             self.general_settings_frame,
             textvariable=self.theme_var,
-            values=["default", "light", "dark"]
+            values=self._THEMES
         )
         theme_combo.pack(anchor='w', padx=5, pady=2)
         
         # Logging settings
-        self.logging_frame = ttk.LabelFrame(
-            self.settings_tab,
-            text="Logging",
-            padding=5
-        )
-        self.logging_frame.pack(fill='x', padx=5, pady=5)
+        self.logging_frame = self._mk_frame(self.settings_tab, "Logging")
         
         # Log level
         ttk.Label(self.logging_frame, text="Log Level:").pack(anchor='w', padx=5, pady=2)
@@ -803,7 +897,7 @@ class TaNKsHubGUI:
         log_level_combo = ttk.Combobox(
             self.logging_frame,
             textvariable=self.log_level_var,
-            values=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
+            values=self._LOG_LEVELS
         )
         log_level_combo.pack(anchor='w', padx=5, pady=2)
         
@@ -830,12 +924,54 @@ class TaNKsHubGUI:
         # Save settings button
         self.add_memory_management_to_settings()
 
+    def on_main_tab_changed(self, event=None):
+        """Rebuild the dashboard when it is selected and its data has changed."""
+        if self._dashboard_dirty and self.notebook.select() == str(self.dashboard_tab):
+            self.setup_dashboard_tab()
+
+    def mark_dashboard_dirty(self):
+        """Note that dashboard data changed; it is rebuilt when idle, if it is showing.
+        
+        Changes made before the app goes idle share a single check and rebuild.
+        """
+        self._dashboard_dirty = True
+        if not self._dashboard_check_scheduled:
+            self._dashboard_check_scheduled = True
+            self.root.after_idle(self._check_dashboard)
+
+    def _check_dashboard(self):
+        """Run the idle dashboard check queued by mark_dashboard_dirty()."""
+        self._dashboard_check_scheduled = False
+        self.on_main_tab_changed()
+
     def setup_dashboard_tab(self):
-        """Set up the dashboard tab with module summaries and status."""
-        # Clear existing content
-        for widget in self.dashboard_tab.winfo_children():
-            widget.destroy()
-            
+        """Set up the dashboard tab with module summaries and status.
+        
+        The header and columns are built once; each refresh rebuilds the panels
+        inside them, skipping the API usage panel when its stats haven't changed.
+        """
+        self._dashboard_dirty = False
+        
+        if self._dashboard_slots is None:
+            self._build_dashboard_layout()
+        slots = self._dashboard_slots
+        
+        # Add API Usage Panel to right column, before or after the modules summary
+        self.create_api_usage_panel(slots['api'])
+    
+        # Modules summary panel (right column)
+        self.create_modules_summary_panel(slots['modules'])
+
+        # System info panel (left column, top)
+        self._clear_frame(slots['system'])
+        self.create_system_info_panel(slots['system'])
+        
+        # Files panel (left column, bottom)
+        self._clear_frame(slots['files'])
+        self.create_files_panel(slots['files'])
+    
+    def _build_dashboard_layout(self):
+        """Create the dashboard header and the frames that hold each panel."""
         # Create a welcome header
         header_frame = ttk.Frame(self.dashboard_tab)
         header_frame.pack(fill='x', padx=10, pady=10)
@@ -864,29 +1000,29 @@ class TaNKsHubGUI:
         # Right column
         right_column = ttk.Frame(content_frame)
         right_column.pack(side='right', fill='both', expand=True, padx=5)
-    
-        # Add API Usage Panel to right column, before or after the modules summary
-        self.create_api_usage_panel(right_column)
-    
-        # Modules summary panel
-        self.create_modules_summary_panel(right_column)
-
-        # System info panel (left column, top)
-        self.create_system_info_panel(left_column)
         
-        # Files panel (left column, bottom)
-        self.create_files_panel(left_column)
-        
-        # Modules summary panel (right column)
-        self.create_modules_summary_panel(right_column)
+        # One frame per panel, packed like the panel it holds, so a panel can be
+        # rebuilt without disturbing the others
+        self._dashboard_slots = {}
+        for name, column, grow in (('api', right_column, False),
+                                   ('modules', right_column, True),
+                                   ('system', left_column, False),
+                                   ('files', left_column, True)):
+            slot = ttk.Frame(column)
+            slot.pack(fill='both' if grow else 'x', expand=grow)
+            self._dashboard_slots[name] = slot
+    
+    @staticmethod
+    def _clear_frame(frame):
+        """Destroy every widget inside a frame."""
+        for widget in frame.winfo_children():
+            widget.destroy()
     
     def create_system_info_panel(self, parent):
         """Create the system info panel for the dashboard."""
-        info_frame = ttk.LabelFrame(parent, text="System Info", padding=10)
-        info_frame.pack(fill='x', padx=5, pady=5)
+        info_frame = self._mk_frame(parent, "System Info", padding=10)
         
-        import platform
-        system_info = f"Python {platform.python_version()} on {platform.system()} {platform.release()}"
+        system_info = SYSTEM_INFO
         
         ttk.Label(
             info_frame,
@@ -894,7 +1030,6 @@ class TaNKsHubGUI:
         ).pack(anchor='w')
         
         # Add current time 
-        from datetime import datetime
         now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         ttk.Label(
             info_frame,
@@ -916,8 +1051,7 @@ class TaNKsHubGUI:
     
     def create_files_panel(self, parent):
         """Create the files info panel for the dashboard."""
-        files_frame = ttk.LabelFrame(parent, text="Current Files", padding=10)
-        files_frame.pack(fill='both', expand=True, padx=5, pady=5)
+        files_frame = self._mk_frame(parent, "Current Files", padding=10, fill='both', expand=True)
         
         file_count = len(self.file_paths)
         ttk.Label(
@@ -926,57 +1060,31 @@ class TaNKsHubGUI:
             font=("", 10, "bold")
         ).pack(anchor='w', pady=5)
         
-        # Create scrollable frame for file list
-        file_list_frame = ttk.Frame(files_frame)
-        file_list_frame.pack(fill='both', expand=True)
-        
-        # Add scrollbar and canvas for scrolling
-        canvas = tk.Canvas(file_list_frame)
-        scrollbar = ttk.Scrollbar(file_list_frame, orient="vertical", command=canvas.yview)
-        scrollable_frame = ttk.Frame(canvas)
-        
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-        
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-        
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
-        
         if file_count > 0:
-            # Display files in the scrollable frame
-            for i, file_path in enumerate(self.file_paths):
-                file_frame = ttk.Frame(scrollable_frame)
-                file_frame.pack(fill='x', pady=2)
-                
-                # Get file extension and determine icon color
-                ext = Path(file_path).suffix.lower()
-                icon_color = "blue"  # Default
-                
-                if ext in ['.mp4', '.mkv', '.avi', '.mov']:
-                    icon_color = "red"  # Video files
-                elif ext in ['.jpg', '.png', '.gif']:
-                    icon_color = "green"  # Image files
-                elif ext in ['.mp3', '.wav', '.flac']:
-                    icon_color = "purple"  # Audio files
-                    
-                # Create colored icon indicator
-                icon = self.create_colored_icon(icon_color, (12, 12))
-                icon_label = ttk.Label(file_frame, image=icon)
-                icon_label.image = icon  # Keep a reference to prevent garbage collection
-                icon_label.pack(side='left', padx=5)
-                
-                # Display filename
-                ttk.Label(
-                    file_frame,
-                    text=os.path.basename(file_path)
-                ).pack(side='left')
+            # A Treeview only draws the visible rows, so a large drop doesn't create a widget per file
+            file_list_frame = ttk.Frame(files_frame)
+            file_list_frame.pack(fill='both', expand=True)
+            
+            scrollbar = ttk.Scrollbar(file_list_frame, orient="vertical")
+            file_list = ttk.Treeview(
+                file_list_frame,
+                show="tree",
+                selectmode="none",
+                yscrollcommand=scrollbar.set
+            )
+            scrollbar.config(command=file_list.yview)
+            
+            file_list.pack(side="left", fill="both", expand=True)
+            scrollbar.pack(side="right", fill="y")
+            
+            for file_path in self.file_paths:
+                # Name and extension were split when the file was listed
+                folder, name, ext = self._file_info(file_path)
+                icon_color = FILE_TYPE_COLORS.get(ext, "blue")
+                file_list.insert('', 'end', text=name, image=self.create_colored_icon(icon_color, (12, 12)))
         else:
             ttk.Label(
-                scrollable_frame,
+                files_frame,
                 text="No files loaded. Drag and drop files or click the Files tab to add some.",
                 wraplength=250
             ).pack(anchor='w', padx=10, pady=20)
@@ -989,20 +1097,34 @@ class TaNKsHubGUI:
         ).pack(pady=10)
     
     def create_modules_summary_panel(self, parent):
-        """Create the modules summary panel for the dashboard."""
-        modules_frame = ttk.LabelFrame(parent, text="Modules", padding=10)
-        modules_frame.pack(fill='both', expand=True, padx=5, pady=5)
+        """Create the modules summary panel for the dashboard.
         
+        The cards are kept between refreshes and only their status is updated,
+        unless the set of registered modules has changed.
+        """
         # Get all modules
-        all_modules = list(self.module_manager.modules.values())
-        enabled_modules = [m for m in all_modules if m.enabled]
+        all_modules = self.module_manager.get_all_modules()
+        enabled_modules = self.module_manager.get_enabled_modules()
+        count_text = f"Enabled: {len(enabled_modules)}/{len(all_modules)} modules"
+        
+        if all_modules is self._module_cards_for and parent.winfo_children():
+            self._modules_count_label.configure(text=count_text)
+            for module in all_modules:
+                self._update_module_card(module)
+            return
+        self._module_cards_for = all_modules
+        self._clear_frame(parent)
+        self._module_card_widgets.clear()
+        
+        modules_frame = self._mk_frame(parent, "Modules", padding=10, fill='both', expand=True)
         
         # Show enabled count
-        ttk.Label(
+        self._modules_count_label = ttk.Label(
             modules_frame,
-            text=f"Enabled: {len(enabled_modules)}/{len(all_modules)} modules",
+            text=count_text,
             font=("", 10, "bold")
-        ).pack(anchor='w', pady=5)
+        )
+        self._modules_count_label.pack(anchor='w', pady=5)
         
         # Create scrollable frame for module cards
         cards_frame = ttk.Frame(modules_frame)
@@ -1013,6 +1135,14 @@ class TaNKsHubGUI:
         scrollbar = ttk.Scrollbar(cards_frame, orient="vertical", command=canvas.yview)
         scrollable_frame = ttk.Frame(canvas)
         
+        # Cards by module name; entries go away with the card widgets
+        self.module_cards = weakref.WeakValueDictionary()
+        
+        # Create a card for each module before the frame goes into the canvas,
+        # so it is laid out and the scroll region computed once for all cards
+        for module in all_modules:
+            self.module_cards[module.name] = self.create_module_card(scrollable_frame, module)
+        
         scrollable_frame.bind(
             "<Configure>",
             lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
@@ -1024,14 +1154,6 @@ class TaNKsHubGUI:
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
         
-        # Keep references to card widgets to prevent garbage collection
-        self.module_cards = []
-        
-        # Create a card for each module
-        for module in all_modules:
-            card = self.create_module_card(scrollable_frame, module)
-            self.module_cards.append(card)
-        
         # Add a button to go to the modules tab
         ttk.Button(
             modules_frame,
@@ -1040,118 +1162,93 @@ class TaNKsHubGUI:
         ).pack(pady=10)
     
     def create_module_card(self, parent, module):
-        """Create a summary card for a module."""
-        # Create a bordered frame for the card
-        card_frame = ttk.Frame(parent)
-        card_frame.pack(fill='x', pady=5, padx=5)
-        
-        # Create an inner frame with padding and border
-        inner_frame = ttk.Frame(card_frame, padding=8)
-        inner_frame.pack(fill='x', expand=True)
+        """Create a summary card for a module.
         
-        # Add a thin border around the card
-        card_border = ttk.Frame(card_frame, style='Card.TFrame')
-        card_border.place(x=0, y=0, relwidth=1, relheight=1)
+        The card is a single bordered frame with its labels gridded directly
+        inside it, rather than nested header/status/action frames.
+        """
+        card_frame = ttk.Frame(parent, style='Card.TFrame', padding=8)
+        card_frame.pack(fill='x', pady=5, padx=5)
+        card_frame.columnconfigure(1, weight=1)
         
         # Get the appropriate icon
         icon = self.module_icons.get(module.name, self.module_icons.get("default"))
         
-        # Header with icon and title
-        header_frame = ttk.Frame(inner_frame)
-        header_frame.pack(fill='x', pady=(0, 5))
-        
-        icon_label = ttk.Label(header_frame, image=icon)
-        icon_label.image = icon  # Keep a reference to prevent garbage collection
-        icon_label.pack(side='left', padx=(0, 5))
+        # Header: icon, title and status indicator (filled in by _update_module_card)
+        ttk.Label(card_frame, image=icon).grid(row=0, column=0, sticky='w', padx=(0, 5), pady=(0, 5))
         
         ttk.Label(
-            header_frame,
+            card_frame,
             text=module.name,
             font=("", 11, "bold")
-        ).pack(side='left')
-        
-        # Status indicator
-        status_text = "Enabled" if module.enabled else "Disabled"
-        status_color = "green" if module.enabled else "red"
-        
-        status_frame = ttk.Frame(header_frame)
-        status_frame.pack(side='right')
+        ).grid(row=0, column=1, sticky='w', pady=(0, 5))
         
-        status_icon = self.create_colored_icon(status_color, (10, 10))
-        status_icon_label = ttk.Label(status_frame, image=status_icon)
-        status_icon_label.image = status_icon  # Keep a reference
-        status_icon_label.pack(side='left', padx=2)
+        status_icon_label = ttk.Label(card_frame)
+        status_icon_label.grid(row=0, column=2, padx=2, pady=(0, 5))
         
-        ttk.Label(
-            status_frame,
-            text=status_text,
+        status_label = ttk.Label(
+            card_frame,
             font=("", 9)
-        ).pack(side='right')
+        )
+        status_label.grid(row=0, column=3, sticky='e', pady=(0, 5))
         
         # Module description
         ttk.Label(
-            inner_frame,
+            card_frame,
             text=module.description,
             font=("", 9, "italic"),
             wraplength=300
-        ).pack(anchor='w', pady=2)
+        ).grid(row=1, column=0, columnspan=4, sticky='w', pady=2)
         
         # Module-specific info (example)
         # In a real application, you would show module-specific stats here
-        if module.name == "File Mover":
-            ttk.Label(
-                inner_frame,
-                text="Files processed: 0",
-                font=("", 9)
-            ).pack(anchor='w')
-        elif module.name == "File Name Editor":
-            ttk.Label(
-                inner_frame,
-                text="Files renamed: 0",
-                font=("", 9)
-            ).pack(anchor='w')
-        elif module.name == "Media Sorter":
+        stats_text = self._MODULE_CARD_STATS.get(module.name)
+        if stats_text:
             ttk.Label(
-                inner_frame,
-                text="Files analyzed: 0",
+                card_frame,
+                text=stats_text,
                 font=("", 9)
-            ).pack(anchor='w')
-            
-        # Quick action button
-        action_frame = ttk.Frame(inner_frame)
-        action_frame.pack(fill='x', pady=(5, 0))
+            ).grid(row=2, column=0, columnspan=4, sticky='w')
         
-        # Different actions based on current state
-        if module.enabled:
-            ttk.Button(
-                action_frame,
-                text="Configure",
-                command=lambda m=module: self.goto_module_tab(m)
-            ).pack(side='right', padx=2)
-        else:
-            ttk.Button(
-                action_frame,
-                text="Enable",
-                command=lambda m=module: self.enable_module_and_goto(m)
-            ).pack(side='right', padx=2)
+        # Quick action button; action depends on current state, set by _update_module_card
+        action_button = ttk.Button(card_frame)
+        action_button.grid(row=3, column=0, columnspan=4, sticky='e', padx=2, pady=(5, 0))
         
-        # Store icon references in the card frame
-        card_frame.icon = icon
-        card_frame.status_icon = status_icon
+        self._module_card_widgets[module.name] = {
+            'status_icon': status_icon_label,
+            'status': status_label,
+            'action': action_button,
+        }
+        self._update_module_card(module)
         
         return card_frame
     
+    def _update_module_card(self, module):
+        """Show a module's current enabled state on its dashboard card."""
+        widgets = self._module_card_widgets.get(module.name)
+        if widgets is None:
+            return
+        
+        if module.enabled:
+            status_text, status_color = "Enabled", "green"
+            action_text, action = "Configure", lambda m=module: self.goto_module_tab(m)
+        else:
+            status_text, status_color = "Disabled", "red"
+            action_text, action = "Enable", lambda m=module: self.enable_module_and_goto(m)
+        
+        widgets['status_icon'].configure(image=self.create_colored_icon(status_color, (10, 10)))
+        widgets['status'].configure(text=status_text)
+        widgets['action'].configure(text=action_text, command=action)
+    
     def goto_module_tab(self, module):
         """Navigate to a specific module's tab."""
         # Select the modules tab first
         self.notebook.select(self.modules_frame)
         
-        # Find the module's tab index
-        for i, tab_id in enumerate(self.modules_notebook.tabs()):
-            tab_text = self.modules_notebook.tab(tab_id, "text")
-            if tab_text == module.name:
-                self.modules_notebook.select(i)
-                break
+        # Select the module's tab if it is in the notebook
+        module_tab = self.active_modules.get(module.name)
+        if module_tab is not None:
+            self.modules_notebook.select(module_tab)
     
     def enable_module_and_goto(self, module):
         """Enable a module and navigate to its tab."""
@@ -1160,11 +1257,10 @@ class TaNKsHubGUI:
             module.on_enable_changed(True)
         
         # Save the new state
-        if hasattr(self.module_manager, '_save_config'):
-            self.module_manager._save_config()
+        self.module_manager.flush_config()
         
         # Update the dashboard
-        self.setup_dashboard_tab()
+        self.mark_dashboard_dirty()
         
         # Navigate to the module's tab
         self.goto_module_tab(module)
@@ -1178,27 +1274,33 @@ class TaNKsHubGUI:
                 # If module is being enabled, send current file list
                 if hasattr(module, 'sync_with_main_list'):
                     module.sync_with_main_list(self.file_paths)
-        if hasattr(self.module_manager, '_save_config'):
-            self.module_manager._save_config()  # Save the new state
+        self.module_manager.flush_config()  # Save the new state, if it changed
         
-        # Refresh the dashboard if it exists
-        if hasattr(self, 'dashboard_tab'):
-            self.setup_dashboard_tab()
+        # Refresh the dashboard next time it is shown
+        self.mark_dashboard_dirty()
             
         logger.info(f"Module {module.name} {'enabled' if module.enabled else 'disabled'}")
 
     def handle_drop(self, event):
-        """Handle file drop events with robust parsing and folder support."""
-        # Create a handler if it doesn't exist
-        if not hasattr(self, 'drop_handler'):
-            self.drop_handler = DragDropHandler(self.logger)
+        """Queue the drop data and return so the OS drag operation can finish."""
+        self._pending_drops.append(event.data)
+        if len(self._pending_drops) == 1:
+            self.root.after_idle(self._process_drop)
+        # Tell the drag source the drop was accepted with the action it offered
+        return event.action
+
+    def _process_drop(self):
+        """Parse queued drops, expanding folders, and hand the files to the modules."""
+        drops, self._pending_drops = self._pending_drops, []
     
         # Show a progress dialog for longer operations
         prog_win = None
         try:
             # Use the handler to parse the drop data
             # This will handle the initial parsing of paths
-            parsed_paths = self.drop_handler.parse_dropped_files(event.data)
+            parsed_paths = []
+            for data in drops:
+                parsed_paths.extend(self.drop_handler.parse_dropped_files(data))
         
             # If we have many paths (which might include folders), show a progress dialog
             if len(parsed_paths) > 5:
@@ -1226,7 +1328,7 @@ class TaNKsHubGUI:
                 files_count_label = ttk.Label(prog_win, textvariable=files_count_var)
                 files_count_label.pack(pady=5)
             
-                prog_win.update()
+                prog_win.update_idletasks()
         
             # Process the parsed paths and expand folders
             self.logger.info(f"Processing {len(parsed_paths)} dropped paths")
@@ -1235,7 +1337,8 @@ class TaNKsHubGUI:
             supported_extensions = self.get_all_supported_extensions()
             self.logger.debug(f"Supported extensions: {supported_extensions}")
         
-            # Process all the paths 
+            # Process all the paths. parse_dropped_files has already expanded
+            # folders and skipped missing paths, so only the type check is left.
             final_files = []
             for i, path_str in enumerate(parsed_paths):
                 path = Path(path_str)
@@ -1245,22 +1348,11 @@ class TaNKsHubGUI:
                     progress_var.set((i / len(parsed_paths)) * 100)
                     file_label_var.set(f"Processing: {path.name}")
                     files_count_var.set(f"Found {len(final_files)} files so far")
-                    prog_win.update()
+                    prog_win.update_idletasks()
             
-                # Handle directory
-                if path.is_dir():
-                    self.logger.info(f"Processing directory: {path}")
-                    for root, dirs, files in os.walk(path):
-                        for file in files:
-                            file_path = Path(root) / file
-                            # Check if this file type is supported by any module
-                            if '*' in supported_extensions or file_path.suffix.lower() in supported_extensions:
-                                final_files.append(str(file_path))
-                # Handle individual file
-                elif path.is_file():
-                    # Check if this file type is supported
-                    if '*' in supported_extensions or path.suffix.lower() in supported_extensions:
-                        final_files.append(str(path))
+                # Check if this file type is supported
+                if '*' in supported_extensions or path.suffix.lower() in supported_extensions:
+                    final_files.append(str(path))
         
             # Close progress dialog if we have one
             if prog_win:
@@ -1270,18 +1362,16 @@ class TaNKsHubGUI:
             # Update the file list display with the final list of files
             self.logger.info(f"Found {len(final_files)} valid files")
         
-            # Update file list display
-            self.update_file_list_display(final_files)
-    
-            # Store file paths
-            self.file_paths = final_files
+            # Add to the file list, skipping files that are already there;
+            # only the new rows are drawn
+            new_files = self.add_files(final_files)
     
-            # Process files with enabled modules
-            self.process_files(final_files)
+            # Process the new files with enabled modules
+            if new_files:
+                self.process_files(new_files)
         
         except Exception as e:
             self.logger.error(f"Error processing dropped files: {str(e)}")
-            import traceback
             self.logger.error(traceback.format_exc())
             messagebox.showerror("Error", f"An error occurred while processing dropped files: {str(e)}")
         finally:
@@ -1308,105 +1398,158 @@ class TaNKsHubGUI:
 
     def update_file_list_display(self, files):
         """Update the file list display with improved UI elements."""
-        # Clear the existing list
-        for widget in self.file_list_frame.winfo_children():
-            if widget != self.file_list_actions_frame:
-                widget.destroy()
+        # Clear the existing list; the full redraw includes any pending files
+        self.file_tree.delete(*self.file_tree.get_children())
+        self._pending_files = []
     
-        # Create a frame for the file list with scrollbar
-        list_container = ttk.Frame(self.file_list_frame)
-        list_container.pack(fill='both', expand=True, padx=5, pady=5)
+        # files becomes the current file list, so rebuild the duplicate check set
+        # and drop cached details of files no longer listed
+        self._file_set = {self._file_key(file_path) for file_path in files}
+        self._file_info_cache = {file_path: self._file_info(file_path) for file_path in files}
     
-        # Add a scrollbar
-        scrollbar = ttk.Scrollbar(list_container)
-        scrollbar.pack(side='right', fill='y')
-    
-        # Create a canvas for scrolling
-        canvas = tk.Canvas(list_container, yscrollcommand=scrollbar.set)
-        canvas.pack(side='left', fill='both', expand=True)
-        scrollbar.config(command=canvas.yview)
-    
-        # Create a frame inside the canvas for the file items
-        file_frame = ttk.Frame(canvas)
-        canvas.create_window((0, 0), window=file_frame, anchor='nw', tags="file_frame")
-    
-        # Add each file as a row with controls
+        # Add each file as a row
         for i, file_path in enumerate(files):
-            row_frame = ttk.Frame(file_frame)
-            row_frame.pack(fill='x', padx=5, pady=2)
-        
-            # File path display (truncated if too long)
-            path = Path(file_path)
-            display_text = f"{i+1}. {path.name}"
-        
-            # Add an icon based on file type
-            ext = path.suffix.lower()
-            icon_color = "blue"  # Default
-        
-            if ext in ['.mp4', '.mkv', '.avi', '.mov']:
-                icon_color = "red"  # Video files
-            elif ext in ['.jpg', '.png', '.gif']:
-                icon_color = "green"  # Image files
-            elif ext in ['.mp3', '.wav', '.flac']:
-                icon_color = "purple"  # Audio files
-            
-            icon = self.create_colored_icon(icon_color, (12, 12))
-            icon_label = ttk.Label(row_frame, image=icon)
-            icon_label.image = icon  # Keep a reference
-            icon_label.pack(side='left', padx=2)
-        
-            ttk.Label(row_frame, text=display_text).pack(side='left', padx=5, fill='x', expand=True)
-        
-            # Remove button
-            remove_btn = ttk.Button(
-                row_frame,
-                text="✕", 
-                width=3,
-                command=lambda idx=i: self.remove_file(idx)
-            )
-            remove_btn.pack(side='right', padx=2)
-        
-            # Store the full path as an attribute for tooltip
-            row_frame.file_path = file_path
+            self._insert_file_row(i, file_path)
+    
+        # Update file count label
+        if hasattr(self, 'file_count_label'):
+            self.file_count_label.config(text=f"Total: {len(files)} files")
+        self.mark_dashboard_dirty()
+
+    def _file_info(self, file_path):
+        """Return (folder, name, lower-case extension) for a listed file, split only once."""
+        info = self._file_info_cache.get(file_path)
+        if info is None:
+            folder, name = os.path.split(file_path)
+            info = (folder, name, os.path.splitext(name)[1].lower())
+            self._file_info_cache[file_path] = info
+        return info
+
+    def _insert_file_row(self, index, file_path):
+        """Add one file to the end of the file list; its position matches its index in file_paths."""
+        folder, name, ext = self._file_info(file_path)
+    
+        # Add an icon based on file type
+        icon_color = FILE_TYPE_COLORS.get(ext, "blue")
+    
+        self.file_tree.insert(
+            '', 'end',
+            text=f"{index+1}. {name}",
+            image=self.file_type_icons[icon_color],
+            values=(folder,)
+        )
+
+    @staticmethod
+    def _file_key(file_path):
+        """Return the key that identifies a file regardless of case or slash style."""
+        return os.path.normcase(os.path.normpath(file_path))
+
+    def add_files(self, files: Iterable[str]):
+        """Append files to the file list, drawing the new rows in one batch when idle.
         
-            # Add tooltip for the full path on hover
-            self.add_tooltip(row_frame, file_path)
+        Files already in the list are skipped. Returns the files that were added.
+        """
+        new_files = []
+        for file_path in files:
+            key = self._file_key(file_path)
+            if key not in self._file_set:
+                self._file_set.add(key)
+                new_files.append(file_path)
+    
+        if new_files:
+            self.file_paths = self.file_paths + new_files
+            self._pending_files.extend(new_files)
+            if not self._flush_scheduled:
+                self._flush_scheduled = True
+                self.root.after_idle(self._flush_files)
+        return new_files
+
+    def _flush_files(self):
+        """Insert the rows for files added since the last flush."""
+        self._flush_scheduled = False
+        pending, self._pending_files = self._pending_files, []
     
-        # Update the canvas scroll region
-        file_frame.bind("<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
+        start = len(self.file_tree.get_children())
+        for i, file_path in enumerate(pending, start):
+            self._insert_file_row(i, file_path)
     
         # Update file count label
         if hasattr(self, 'file_count_label'):
-            self.file_count_label.config(text=f"Total: {len(files)} files")
+            self.file_count_label.config(text=f"Total: {len(self.file_paths)} files")
+        self.mark_dashboard_dirty()
 
     def add_tooltip(self, widget, text):
-        """Add a tooltip to a widget."""
-        def enter(event):
-            x, y, _, _ = widget.bbox("insert")
-            x += widget.winfo_rootx() + 25
-            y += widget.winfo_rooty() + 25
-        
-            # Create a toplevel window
-            self.tooltip = tk.Toplevel(widget)
-            self.tooltip.wm_overrideredirect(True)
-            self.tooltip.wm_geometry(f"+{x}+{y}")
+        """Add a tooltip to a widget.
         
-            label = ttk.Label(self.tooltip, text=text, wraplength=500,
-                             background="#ffffe0", relief="solid", borderwidth=1)
-            label.pack(ipadx=5, ipady=5)
+        The widget gets the 'Tooltip' bind tag rather than bindings of its own,
+        so any number of tooltips share the handlers bound in __init__.
+        """
+        key = str(widget)
+        if key not in self._tooltip_texts:
+            widget.bindtags(('Tooltip',) + widget.bindtags())
+        self._tooltip_texts[key] = text
+
+    def _show_tooltip(self, event):
+        """Show the tooltip of the widget the mouse entered."""
+        widget = event.widget
+        text = self._tooltip_texts.get(str(widget))
+        if text is None:
+            return
+        x = widget.winfo_rootx() + 25
+        y = widget.winfo_rooty() + 25
     
-        def leave(event):
-            if hasattr(self, 'tooltip'):
-                self.tooltip.destroy()
-            
-        widget.bind("<Enter>", enter)
-        widget.bind("<Leave>", leave)
+        if self.tooltip is None:
+            # One hidden toplevel window serves every tooltip
+            self.tooltip = tk.Toplevel(self.root)
+            self.tooltip.wm_overrideredirect(True)
+            self._tooltip_label = ttk.Label(self.tooltip, wraplength=500,
+                                            background="#ffffe0", relief="solid", borderwidth=1)
+            self._tooltip_label.pack(ipadx=5, ipady=5)
+    
+        self._tooltip_label.configure(text=text)
+        self.tooltip.wm_geometry(f"+{x}+{y}")
+        self.tooltip.deiconify()
+        self.tooltip.lift()
+
+    def _hide_tooltip(self, event):
+        """Hide the tooltip when the mouse leaves its widget."""
+        if self.tooltip is not None:
+            self.tooltip.withdraw()
 
     def remove_file(self, index):
         """Remove a file from the list."""
         if 0 <= index < len(self.file_paths):
-            del self.file_paths[index]
-            self.update_file_list_display(self.file_paths)
+            self._remove_file_rows({index})
+
+    def remove_selected_files(self):
+        """Remove the files selected in the file list."""
+        selected = {self.file_tree.index(iid) for iid in self.file_tree.selection()}
+        if selected:
+            self._remove_file_rows(selected)
+
+    def _remove_file_rows(self, indices: Set[int]):
+        """Remove the files at the given positions, touching only the rows that change."""
+        # Rows for pending files must exist before positions can be matched up
+        if self._pending_files:
+            self._flush_files()
+    
+        rows = self.file_tree.get_children()
+        self.file_tree.delete(*(rows[i] for i in indices))
+        for i in indices:
+            file_path = self.file_paths[i]
+            self._file_set.discard(self._file_key(file_path))
+            self._file_info_cache.pop(file_path, None)
+        self.file_paths = [fp for i, fp in enumerate(self.file_paths) if i not in indices]
+    
+        # Only the rows below the first removed one need renumbering
+        first = min(indices)
+        for i, iid in enumerate(self.file_tree.get_children()[first:], first):
+            name = self._file_info(self.file_paths[i])[1]
+            self.file_tree.item(iid, text=f"{i+1}. {name}")
+    
+        if hasattr(self, 'file_count_label'):
+            self.file_count_label.config(text=f"Total: {len(self.file_paths)} files")
+        self.mark_dashboard_dirty()
 
     def clear_file_list(self):
         """Clear the entire file list."""
@@ -1435,15 +1578,12 @@ class TaNKsHubGUI:
                 messagebox.showinfo("Information", "None of the selected files are supported by the enabled modules.")
                 return
             
-            # Combine with existing files
-            combined_files = self.file_paths + list(valid_files)
-        
-            # Update UI and internal list
-            self.update_file_list_display(combined_files)
-            self.file_paths = combined_files
+            # Add to the file list, skipping files that are already there
+            new_files = self.add_files(valid_files)
         
             # Process the new files
-            self.process_files(valid_files)
+            if new_files:
+                self.process_files(new_files)
 
     def select_folder(self):
         """Handle folder selection for processing."""
@@ -1474,7 +1614,7 @@ class TaNKsHubGUI:
         file_count_var = tk.StringVar(value="Found: 0 files")
         ttk.Label(prog_win, textvariable=file_count_var).pack(pady=5)
     
-        prog_win.update()
+        prog_win.update_idletasks()
     
         try:
             # Get supported extensions
@@ -1513,15 +1653,12 @@ class TaNKsHubGUI:
                 # Ask user if they want to add the files
                 if messagebox.askyesno("Files Found", 
                                      f"Found {len(files)} supported files in the folder. Add them to the queue?"):
-                    # Combine with existing files
-                    combined_files = self.file_paths + files
-                
-                    # Update UI and internal list
-                    self.update_file_list_display(combined_files)
-                    self.file_paths = combined_files
+                    # Add to the file list, skipping files that are already there
+                    new_files = self.add_files(files)
                 
                     # Process the new files
-                    self.process_files(files)
+                    if new_files:
+                        self.process_files(new_files)
         
             # Start the background scan
             self.run_in_background(scan_folder, scan_complete)
@@ -1559,7 +1696,6 @@ class TaNKsHubGUI:
                 module.clear_cache()
     
         # Force garbage collection
-        import gc
         gc.collect()
     
         self.logger.info("Memory freed successfully")
@@ -1572,6 +1708,9 @@ class TaNKsHubGUI:
         if not enabled_modules:
             return  # No enabled modules
     
+        # Modules are about to produce queue messages, so poll at full rate again
+        self._poll_idle_streak = 0
+    
         # Show a progress dialog for large file sets
         if len(file_paths) > 10:
             progress_window = tk.Toplevel(self.root)
@@ -1594,82 +1733,146 @@ class TaNKsHubGUI:
             status_label = ttk.Label(progress_window, textvariable=status_var)
             status_label.pack(pady=5)
         
-            progress_window.update()
+            progress_window.update_idletasks()
         else:
             progress_window = None
             progress_var = None
             status_var = None
     
+        processed = 0
+        last_update = 0.0
+        progress_lock = threading.Lock()
+        # Workers post (count, status) updates here and None when all are done;
+        # only the Tk thread, in drain_progress, touches the dialog
+        progress_queue = queue.Queue()
+    
+        def advance(module_name, file_name):
+            """Count a file and post a progress update, at most once per PROGRESS_UPDATE_INTERVAL."""
+            nonlocal processed, last_update
+            with progress_lock:
+                processed += 1
+                now = time.monotonic()
+                if now - last_update < PROGRESS_UPDATE_INTERVAL:
+                    return
+                last_update = now
+                count = processed
+            progress_queue.put((count, f"Processing with {module_name}: {file_name}"))
+    
+        def drain_progress():
+            """Show the latest queued progress update; runs on the Tk thread."""
+            latest = None
+            try:
+                while True:
+                    update = progress_queue.get_nowait()
+                    if update is None:
+                        progress_window.destroy()
+                        return
+                    latest = update
+            except queue.Empty:
+                pass
+        
+            if latest is not None:
+                progress_var.set(latest[0])
+                status_var.set(latest[1])
+            self.root.after(PROGRESS_POLL_MS, drain_progress)
+    
+        # Each file's name and extension, shared by all modules
+        file_entries = [(file_path, *self._file_info(file_path)[1:]) for file_path in file_paths]
+    
+        def process_module(module):
+            """Hand every file to one module, in order.
+
+            Runs on a file_pool thread. Only this method's progress updates are
+            marshalled to the Tk thread; several modules' process_file still
+            refresh their own widgets directly.
+            """
+            extensions = frozenset(module.get_supported_extensions())
+            accepts_all = '*' in extensions
+            for file_path, file_name, suffix in file_entries:
+                # Update progress if we have a UI
+                if progress_window:
+                    advance(module.name, file_name)
+            
+                # Check if module supports this file type
+                if accepts_all or suffix in extensions:
+                    try:
+                        # Process using the same source and destination initially
+                        success = module.process_file(file_path, file_path)
+                        #success = True
+                        # Lazy %-formatting: skipped entirely when INFO is filtered out
+                        if success:
+                            self.logger.info("Successfully processed %s with %s", file_path, module.name)
+                        else:
+                            self.logger.warning("Failed to process %s with %s", file_path, module.name)
+                    except Exception as e:
+                        self.logger.error(f"Error processing {file_path} with {module.name}: {str(e)}")
+                        self.logger.error(traceback.format_exc())
+    
         # Define the background processing task
         def process_task():
-            processed = 0
-            for module in enabled_modules:
-                # Skip if module doesn't support file processing
-                if not hasattr(module, 'process_file'):
-                    continue
-                
-                for file_path in file_paths:
-                    path = Path(file_path)
-                    extensions = module.get_supported_extensions()
-                
-                    # Update progress if we have a UI
-                    if progress_window:
-                        processed += 1
-                        progress_var.set(processed)
-                        status_var.set(f"Processing with {module.name}: {path.name}")
-                        self.root.after(0, progress_window.update)
-            
-                    # Check if module supports this file type
-                    if '*' in extensions or path.suffix.lower() in extensions:
-                        try:
-                            # Process using the same source and destination initially
-                            success = module.process_file(path, path)
-                            #success = True
-                            if success:
-                                self.logger.info(f"Successfully processed {path} with {module.name}")
-                            else:
-                                self.logger.warning(f"Failed to process {path} with {module.name}")
-                        except Exception as e:
-                            self.logger.error(f"Error processing {path} with {module.name}: {str(e)}")
-                            import traceback
-                            self.logger.error(traceback.format_exc())
-        
-            # Close progress window if we have one
-            if progress_window:
-                self.root.after(0, progress_window.destroy)
+            try:
+                # Modules keep their own queues, so each module gets one worker
+                # and sees the files in order, while modules run side by side
+                futures = {
+                    self.file_pool.submit(process_module, module): module
+                    for module in enabled_modules
+                    # Skip if module doesn't support file processing
+                    if hasattr(module, 'process_file')
+                }
+                for future in as_completed(futures):
+                    try:
+                        future.result()
+                    except Exception as e:
+                        self.logger.error(f"Error processing files with {futures[future].name}: {str(e)}")
+            finally:
+                # Always close the progress window, even if submitting failed
+                if progress_window:
+                    progress_queue.put(None)
     
         # Run the processing in a background thread
         self.run_in_background(process_task)
+        if progress_window:
+            self.root.after(PROGRESS_POLL_MS, drain_progress)
 
     def process_queues(self):
-        """Process module queues with improved efficiency."""
+        """Process module queues with improved efficiency.
+        
+        Modules' process_queues() return True when they handled anything; while
+        none do, polling backs off exponentially.
+        """
+        work_done = False
+        # Check if window has focus
+        has_focus = self.root.focus_displayof() is not None
         try:
             # Only process active modules that are currently visible
             current_tab = self.notebook.select()
             process_modules = self.module_manager.get_enabled_modules()
         
+            if not has_focus:
+                # In the background, only modules that ask for it are polled;
+                # the rest catch up when the window gets focus back
+                process_modules = [m for m in process_modules if m.always_poll]
             # If we're in the modules tab, only process the visible module
-            if current_tab == str(self.modules_frame) and hasattr(self, 'modules_notebook'):
+            elif current_tab == str(self.modules_frame) and hasattr(self, 'modules_notebook'):
                 current_module_tab = self.modules_notebook.select()
-                if current_module_tab:
-                    # Get the module name from the tab text
-                    for module_name, frame in self.active_modules.items():
-                        if str(frame) == current_module_tab:
-                            # Only process this module's queues
-                            module = next((m for m in process_modules if m.name == module_name), None)
-                            if module and hasattr(module, 'process_queues'):
-                                try:
-                                    module.process_queues()
-                                except Exception as e:
-                                    logger.error(f"Error processing queues for module {module_name}: {str(e)}")
-                            process_modules = []  # Skip the rest
-                            break
+                # Get the module name from the selected tab
+                module_name = self._module_tab_names.get(current_module_tab)
+                if module_name in self.active_modules:
+                    # Only process this module's queues
+                    module = self.module_manager.modules.get(module_name)
+                    if module and module.enabled and hasattr(module, 'process_queues'):
+                        try:
+                            work_done = bool(module.process_queues())
+                        except Exception as e:
+                            logger.error(f"Error processing queues for module {module_name}: {str(e)}")
+                    process_modules = []  # Skip the rest
         
             # Process the remaining modules' queues
             for module in process_modules:
                 if hasattr(module, 'process_queues'):
                     try:
-                        module.process_queues()
+                        if module.process_queues():
+                            work_done = True
                     except Exception as e:
                         logger.error(f"Error processing queues for module {module.name}: {str(e)}")
     
@@ -1678,10 +1881,13 @@ class TaNKsHubGUI:
     
         # Schedule next queue check with a longer interval if not in focus
         if hasattr(self, 'root'):  # Check if GUI still exists
-            # Check if window has focus
-            has_focus = self.root.focus_displayof() is not None
             # Use shorter interval when in focus, longer when not
-            interval = 100 if has_focus else 500
+            interval = QUEUE_POLL_MS if has_focus else QUEUE_POLL_UNFOCUSED_MS
+            if work_done:
+                self._poll_idle_streak = 0
+            else:
+                interval = min(QUEUE_POLL_MAX_MS, interval << self._poll_idle_streak)
+                self._poll_idle_streak = min(self._poll_idle_streak + 1, 5)
             self.root.after(interval, self.process_queues)
 
     def save_settings(self):
@@ -1718,24 +1924,30 @@ class TaNKsHubGUI:
         api_tracker = None
         media_sorter = None
     
-        for module in self.module_manager.modules.values():
+        for module in self.module_manager.get_all_modules():
             if module.name == "Media Sorter" and hasattr(module, 'api_tracker'):
                 api_tracker = module.api_tracker
                 media_sorter = module
                 break
     
         if not api_tracker:
-            # Create a new tracker if we couldn't find one
+            # Use the app-wide tracker if we couldn't find one
             from tankhub.core.api_tracker import APIUsageTracker
-            api_tracker = APIUsageTracker()
-    
-        # Create the frame
-        api_frame = ttk.LabelFrame(parent, text="API Usage", padding=10)
-        api_frame.pack(fill='x', padx=5, pady=5)
+            api_tracker = APIUsageTracker.shared()
     
         # Get current API stats
         api_stats = api_tracker.get_usage_stats()
     
+        # Keep the existing panel when nothing it shows has changed
+        snapshot = ({name: dict(stats) for name, stats in api_stats.items()}, media_sorter is not None)
+        if snapshot == self._api_panel_stats and parent.winfo_children():
+            return parent.winfo_children()[0]
+        self._api_panel_stats = snapshot
+        self._clear_frame(parent)
+    
+        # Create the frame
+        api_frame = self._mk_frame(parent, "API Usage", padding=10)
+    
         if not api_stats:
             ttk.Label(
                 api_frame,
@@ -1775,7 +1987,6 @@ class TaNKsHubGUI:
             
             status_icon = self.create_colored_icon(status_color, (12, 12))
             status_label = ttk.Label(usage_frame, image=status_icon)
-            status_label.image = status_icon  # Keep a reference
             status_label.pack(side='left', padx=5)
         
             # Progress bar
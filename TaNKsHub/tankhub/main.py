@@ -1,13 +1,7 @@
+import atexit
 import logging
-from tkinterdnd2 import TkinterDnD
-from tankhub.gui.main_window import TaNKsHubGUI
-from tankhub.modules.file_mover import FileMoverModule
-from tankhub.modules.file_name_editor import FileNameEditorModule
-from tankhub.modules.media_sorter import MediaSorterModule
-from tankhub.modules.video_converter import VideoConverterModule
-from tankhub.modules.pdf_extractor import PDFExtractorModule
-from tankhub.modules.document_joiner import DocumentJoinerModule
-import tkinterdnd2
+import logging.handlers
+import queue
 
 """
 tankhub/
@@ -32,18 +26,42 @@ tankhub/
     └── video_converter.py      
 """
 
-# Set up logging
+# Set up logging. Callers only enqueue records; a listener thread does the
+# formatting and the file/console writes so busy loops don't block on I/O.
+log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+log_handlers = [
+    logging.FileHandler('tankhub.log'),
+    logging.StreamHandler()
+]
+for handler in log_handlers:
+    handler.setFormatter(log_formatter)
+
+log_queue = queue.Queue(-1)
+log_listener = logging.handlers.QueueListener(log_queue, *log_handlers)
+log_listener.start()
+atexit.register(log_listener.stop)  # Drains queued records before exit
+
+# The queue handler only merges args into the message; the listener's handlers format
+queue_handler = logging.handlers.QueueHandler(log_queue)
+queue_handler.setFormatter(logging.Formatter('%(message)s'))
 logging.basicConfig(
     level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('tankhub.log'),
-        logging.StreamHandler()
-    ]
+    handlers=[queue_handler]
 )
 logger = logging.getLogger(__name__)
 
 def main():
+    # GUI, drag and drop and module imports are deferred until the app starts
+    import tkinterdnd2
+    from tkinterdnd2 import TkinterDnD
+    from tankhub.gui.main_window import TaNKsHubGUI
+    from tankhub.modules.file_mover import FileMoverModule
+    from tankhub.modules.file_name_editor import FileNameEditorModule
+    from tankhub.modules.media_sorter import MediaSorterModule
+    from tankhub.modules.video_converter import VideoConverterModule
+    from tankhub.modules.pdf_extractor import PDFExtractorModule
+    from tankhub.modules.document_joiner import DocumentJoinerModule
+
     logger.debug("Starting TaNKsHub initialization")
     root = TkinterDnD.Tk()
     print(tkinterdnd2.__path__)
@@ -104,6 +122,7 @@ def main():
     app.module_manager.register_module(video_converter)
     app.module_manager.register_module(pdf_extractor)
     app.module_manager.register_module(document_joiner)
+    app.module_manager.flush_config()  # Write the config once for all modules
 
     # Give modules reference to main app for background processing
     file_mover.app = app
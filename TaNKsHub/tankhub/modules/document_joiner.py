@@ -18,7 +18,8 @@ class DocumentJoinerModule(BaseModule):
     def get_supported_extensions(self) -> List[str]:
         return ['.txt', '.md']
 
-    def process_file(self, file_path: Path, dest_path: Path) -> bool:
+    def process_file(self, file_path: str, dest_path: str) -> bool:
+        file_path = Path(file_path)
         if file_path.exists() and file_path.suffix.lower() in self.get_supported_extensions():
             self.queued_files.append(file_path.resolve())
             self._update_preview()
@@ -57,7 +58,7 @@ class DocumentJoinerModule(BaseModule):
     def _add_files(self):
         paths = filedialog.askopenfilenames(title="Select Documents", filetypes=[("Text and Markdown", "*.txt *.md")])
         for p in paths:
-            self.process_file(Path(p), None)
+            self.process_file(p, None)
 
     def _clear_queue(self):
         self.queued_files.clear()
@@ -73,14 +74,16 @@ class DocumentJoinerModule(BaseModule):
             messagebox.showinfo("Info", "No documents in queue.")
             return
 
-        joined_text = ""
+        # Collect the sections and join once; += would copy the text for every file
+        sections = []
         for path in self.queued_files:
             try:
                 with open(path, 'r', encoding='utf-8') as f:
-                    joined_text += f"# {path.name}\n\n{f.read().strip()}\n\n"
+                    sections.append(f"# {path.name}\n\n{f.read().strip()}\n\n")
             except Exception as e:
                 messagebox.showerror("Error", f"Error reading {path.name}: {e}")
                 return
+        joined_text = "".join(sections)
 
         output_dir = Path(self.output_dir_var.get())
         output_dir.mkdir(parents=True, exist_ok=True)
@@ -108,6 +111,7 @@ class DocumentJoinerModule(BaseModule):
 
     def load_settings(self, settings: Dict[str, Any]) -> None:
         self.config.update(settings)
-        self.output_dir_var.set(self.config.get('output_directory', ''))
-        self.output_md_var.set(self.config.get('output_format_md', True))
-        self.output_txt_var.set(self.config.get('output_format_txt', True))
+        if hasattr(self, 'output_dir_var'):
+            self.output_dir_var.set(self.config.get('output_directory', ''))
+            self.output_md_var.set(self.config.get('output_format_md', True))
+            self.output_txt_var.set(self.config.get('output_format_txt', True))
@@ -2,16 +2,38 @@ from dataclasses import dataclass
 from typing import Optional, List, Dict, Any, NamedTuple
 from pathlib import Path
 import os
+import re
 import shutil
 import threading
 import queue
 import logging
+from concurrent.futures import ThreadPoolExecutor
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 from tankhub.core.base_module import BaseModule
 
 logger = logging.getLogger(__name__)
 
+# Matches names that already carry a " (n)" de-duplication suffix
+_NUMBERED_NAME_RE = re.compile(r'^(.*)\s\((\d+)\)$')
+
+# Concurrent copy/move workers; kept low so spinning disks don't thrash
+_MAX_WORKERS = 4
+
+def _scan_dir(directory) -> Optional[Dict[str, os.DirEntry]]:
+    """List a directory once as {normcased name: DirEntry}.
+
+    Returns an empty dict if the directory is missing, or None if it exists but
+    can't be listed (e.g. permissions) so callers can check paths individually.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return {os.path.normcase(entry.name): entry for entry in entries}
+    except FileNotFoundError:
+        return {}
+    except OSError:
+        return None
+
 class FileOperation(NamedTuple):
     source: str
     dest: str
@@ -34,6 +56,9 @@ class FileMoverModule(BaseModule):
         
         # Keep track of queued files
         self.queued_files: List[Path] = []
+        # Set by process_file; the preview and destinations are rebuilt once per
+        # batch from process_queues instead of once per added file
+        self._queue_dirty: bool = False
 
         # Processing state
         self.processing: bool = False
@@ -62,6 +87,11 @@ class FileMoverModule(BaseModule):
             'rename_enabled': False
         }
 
+    @property
+    def always_poll(self) -> bool:
+        """Keep polling in the background while a job is running."""
+        return self.processing
+
     @property
     def rename_enabled(self):
         """Get the current rename enabled state."""
@@ -233,6 +263,9 @@ class FileMoverModule(BaseModule):
         )
         self.cancel_btn.pack(pady=5)
         
+        # Show anything queued before the settings tab was first opened
+        self._update_preview()
+        
         return frame
 
     def _on_rename_toggle(self):
@@ -292,9 +325,25 @@ class FileMoverModule(BaseModule):
         new_dest = Path(self.dest_path.get())
         self.operation_queue = queue.Queue()  # Clear existing queue
 
+        # Resolve settings once for the whole queue rather than per file
+        rename_enabled = self.rename_enabled
+        operation_type = self.operation_var.get() if self.operation_var is not None else self.config['operation_type']
+        filename_parser = self.filename_editor.filename_parser if (rename_enabled and self.filename_editor) else None
+
+        # List each directory once instead of stat-ing every path separately
+        source_dirs = {}
+        dest_listing = _scan_dir(new_dest)
+        dest_names = set(dest_listing) if dest_listing is not None else set()
+
+        def dest_taken(name: str) -> bool:
+            if os.path.normcase(name) in dest_names:
+                return True
+            # Unreadable destination: fall back to checking the path itself
+            return dest_listing is None and (new_dest / name).exists()
+
         # Log current settings
         self.logger.debug(f"Updating queue destination to {new_dest}")
-        self.logger.debug(f"Rename enabled: {self.rename_enabled}")
+        self.logger.debug(f"Rename enabled: {rename_enabled}")
         self.logger.debug(f"Filename editor available: {self.filename_editor is not None}")
 
         for file_path in self.queued_files:
@@ -303,22 +352,36 @@ class FileMoverModule(BaseModule):
                 file_path = Path(file_path) if not isinstance(file_path, Path) else file_path
             
                 # Skip if file doesn't exist
-                if not file_path.exists():
-                    self.logger.warning(f"File no longer exists: {file_path}")
-                    continue
+                parent = str(file_path.parent)
+                if parent not in source_dirs:
+                    source_dirs[parent] = _scan_dir(parent)
+                listing = source_dirs[parent]
+                if listing is None:
+                    # Parent couldn't be listed; stat this path on its own
+                    if not os.path.exists(file_path):
+                        self.logger.warning(f"File no longer exists: {file_path}")
+                        continue
+                    is_file = os.path.isfile(file_path)
+                else:
+                    entry = listing.get(os.path.normcase(file_path.name))
+                    if entry is None:
+                        self.logger.warning(f"File no longer exists: {file_path}")
+                        continue
+                    is_file = entry.is_file()
                 
                 # Determine the filename based on rename setting
                 orig_name = file_path.name
                 dest_name = orig_name  # Default to original name
+                stem, ext = os.path.splitext(orig_name)
         
                 # Check if rename is enabled and we have a filename editor
-                if self.rename_enabled and self.filename_editor:
+                if filename_parser:
                     # Get new filename using the filename editor
-                    self.logger.debug(f"Processing {file_path.stem} for renaming")
-                    media_info = self.filename_editor.filename_parser.parse_filename(file_path.stem)
-                    new_base = self.filename_editor.filename_parser.generate_filename(media_info)
+                    self.logger.debug(f"Processing {stem} for renaming")
+                    media_info = filename_parser.parse_filename(stem)
+                    new_base = filename_parser.generate_filename(media_info)
                     # Always preserve extension for now
-                    dest_name = new_base + file_path.suffix
+                    dest_name = new_base + ext
                     self.logger.debug(f"Generated new name: {orig_name} -> {dest_name}")
                 else:
                     self.logger.debug(f"No renaming applied for {orig_name}")
@@ -327,28 +390,33 @@ class FileMoverModule(BaseModule):
                 final_dest = new_dest / dest_name
             
                 # Check if destination already exists, add a number if needed
-                counter = 1
-                while final_dest.exists() and final_dest != file_path:
-                    base_name = final_dest.stem
+                if dest_taken(dest_name) and final_dest != file_path:
+                    base_name = dest_name[:len(dest_name) - len(ext)] if ext else dest_name
+                    counter = 1
                     # Check if base_name already ends with a number in parentheses
-                    match = re.search(r'^(.*)\s\((\d+)\)$', base_name)
+                    match = _NUMBERED_NAME_RE.search(base_name)
                     if match:
                         # Increment the existing number
                         base_name = match.group(1)
                         counter = int(match.group(2)) + 1
                 
-                    new_name = f"{base_name} ({counter}){file_path.suffix}"
-                    final_dest = new_dest / new_name
-                    counter += 1
+                    while True:
+                        new_name = f"{base_name} ({counter}){ext}"
+                        final_dest = new_dest / new_name
+                        counter += 1
+                        if not dest_taken(new_name) or final_dest == file_path:
+                            break
                     self.logger.debug(f"Destination exists, using {new_name} instead")
+                # Reserve the name so two queued files never share a destination
+                dest_names.add(os.path.normcase(final_dest.name))
         
                 # IMPORTANT: Create the operation with the right rename flag
                 operation = FileOperation(
                     str(file_path.resolve()),  # Use absolute path
                     str(final_dest),
-                    file_path.is_file(),
-                    self.operation_var.get(),
-                    rename=self.rename_enabled
+                    is_file,
+                    operation_type,
+                    rename=rename_enabled
                 )
         
                 # Debug check the operation to ensure rename flag is set correctly
@@ -415,7 +483,7 @@ class FileMoverModule(BaseModule):
             )
             self.current_thread.start()
 
-    def process_file(self, file_path: Path, dest_path: Path) -> bool:
+    def process_file(self, file_path: str, dest_path: str) -> bool:
         """Queue a file for processing with improved path handling."""
         try:
             # Ensure we're working with Path objects
@@ -440,11 +508,10 @@ class FileMoverModule(BaseModule):
             # Add to queue using the resolved path
             self.queued_files.append(file_path_resolved)
             self.logger.debug(f"Added file to queue: {file_path_resolved}")
-            self._update_preview()
-        
-            # Update queue with current settings if destination is set
-            if self.dest_path and self.dest_path.get():
-                self._update_queue_destination()
+
+            # Preview and destinations are refreshed once for the whole batch
+            # by process_queues on the Tk thread
+            self._queue_dirty = True
             
             return True
         
@@ -455,87 +522,56 @@ class FileMoverModule(BaseModule):
             self.logger.error(traceback.format_exc())
             return False
 
+    def _move_file(self, source: str, dest: str) -> None:
+        """Move a single file, trying a plain rename before shutil's copy+delete."""
+        try:
+            os.rename(source, dest)
+        except OSError:
+            # Cross-device move or existing destination on Windows
+            shutil.move(source, dest)
+
     def _process_queue(self) -> None:
         """Process the operation queue with improved error handling."""
+        # Work from the queue as it was when the run started; the Tk thread
+        # swaps in a rebuilt self.operation_queue when files are added mid-run
+        ops = self.operation_queue
         self.logger.debug("Starting to process queue")
-        self.logger.debug(f"Queue size: {self.operation_queue.qsize()}")
+        self.logger.debug(f"Queue size: {ops.qsize()}")
 
-        while self.processing and not self.operation_queue.empty():
-            try:
-                operation = self.operation_queue.get_nowait()
-        
-                self.logger.debug(f"Processing operation: {operation.source} -> {operation.dest}")
-                self.logger.debug(f"Operation type: {operation.operation_type}, Rename: {operation.rename}")
-        
-                if not self.processing:  # Check if cancelled
+        # Destination directories already verified during this run
+        checked_dirs = set()
+        progress_lock = threading.Lock()
+        completed = 0
+
+        def worker():
+            nonlocal completed
+            while self.processing:  # Stop picking up work once cancelled
+                try:
+                    operation = ops.get_nowait()
+                except queue.Empty:
                     break
-                
-                # Verify source file still exists
-                if not Path(operation.source).exists():
-                    error_msg = f"Source file not found: {operation.source}"
-                    self.logger.error(error_msg)
-                    self.message_queue.put(error_msg)
-                    continue
-        
-                # Check if the destination directory exists, create if needed
-                dest_dir = os.path.dirname(operation.dest)
-                if not os.path.exists(dest_dir):
-                    os.makedirs(dest_dir, exist_ok=True)
-                    self.logger.debug(f"Created destination directory: {dest_dir}")
-            
-                # Get source and destination filenames for display
-                source_filename = os.path.basename(operation.source)
-                dest_filename = os.path.basename(operation.dest)
-            
-                if operation.is_file:
-                    # Process single file
-                    if operation.operation_type == "copy":
-                        shutil.copy2(operation.source, operation.dest)
-                        operation_past_tense = "copied"
-                    else:  # move operation
-                        shutil.move(operation.source, operation.dest)
-                        operation_past_tense = "moved"
-                
-                    # Determine the message based on whether renaming was done
-                    if operation.rename and dest_filename != source_filename:
-                        self.message_queue.put(
-                            f"Successfully {operation_past_tense} and renamed {source_filename} to {dest_filename}"
-                        )
-                    else:
-                        self.message_queue.put(
-                            f"Successfully {operation_past_tense} {source_filename}"
-                        )
-                else:
-                    # Process directory
-                    if operation.operation_type == "copy":
-                        shutil.copytree(
-                            operation.source,
-                            operation.dest,
-                            dirs_exist_ok=True
-                        )
-                        operation_past_tense = "copied"
-                    else:  # move operation
-                        shutil.move(operation.source, operation.dest)
-                        operation_past_tense = "moved"
-                
-                    self.message_queue.put(
-                        f"Successfully {operation_past_tense} folder: {os.path.basename(operation.source)}"
-                    )
+
+                self._process_operation(operation, checked_dirs)
 
                 # Update progress
-                remaining = self.operation_queue.qsize()
-                progress = ((self.total_operations - remaining) / self.total_operations) * 100
+                with progress_lock:
+                    completed += 1
+                    done = completed
+                progress = (done / self.total_operations) * 100
                 self.progress_queue.put(
-                    (progress, f"{operation.operation_type.capitalize()}ing files... ({self.total_operations - remaining}/{self.total_operations})")
+                    (progress, f"{operation.operation_type.capitalize()}ing files... ({done}/{self.total_operations})")
                 )
-        
+
+        # Copies release the GIL while in I/O, so a few workers keep the disks busy
+        workers = max(1, min(_MAX_WORKERS, ops.qsize()))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(worker) for _ in range(workers)]
+        for future in futures:
+            try:
+                future.result()
             except Exception as e:
-                self.message_queue.put(
-                    f"Error processing {os.path.basename(operation.source)}: {str(e)}"
-                )
-                self.logger.error(f"Error processing {os.path.basename(operation.source)}: {str(e)}")
-                import traceback
-                self.logger.error(traceback.format_exc())
+                self.message_queue.put(f"Error processing queue: {str(e)}")
+                self.logger.error(f"Error processing queue: {str(e)}")
 
         # Processing complete
         self.processing = False
@@ -543,6 +579,77 @@ class FileMoverModule(BaseModule):
         if self.cancel_btn:
             self.cancel_btn.configure(state="disabled")
 
+    def _process_operation(self, operation: FileOperation, checked_dirs: set) -> bool:
+        """Copy or move one queued file or folder, reporting the outcome to the message queue."""
+        self.logger.debug(f"Processing operation: {operation.source} -> {operation.dest}")
+        self.logger.debug(f"Operation type: {operation.operation_type}, Rename: {operation.rename}")
+
+        try:
+            # Verify source file still exists
+            if not Path(operation.source).exists():
+                error_msg = f"Source file not found: {operation.source}"
+                self.logger.error(error_msg)
+                self.message_queue.put(error_msg)
+                return False
+    
+            # Check if the destination directory exists, create if needed
+            dest_dir = os.path.dirname(operation.dest)
+            if dest_dir not in checked_dirs:
+                if not os.path.exists(dest_dir):
+                    os.makedirs(dest_dir, exist_ok=True)
+                    self.logger.debug(f"Created destination directory: {dest_dir}")
+                checked_dirs.add(dest_dir)
+        
+            # Get source and destination filenames for display
+            source_filename = os.path.basename(operation.source)
+            dest_filename = os.path.basename(operation.dest)
+        
+            if operation.is_file:
+                # Process single file
+                if operation.operation_type == "copy":
+                    self._fast_copy(operation.source, operation.dest)
+                    operation_past_tense = "copied"
+                else:  # move operation
+                    self._move_file(operation.source, operation.dest)
+                    operation_past_tense = "moved"
+            
+                # Determine the message based on whether renaming was done
+                if operation.rename and dest_filename != source_filename:
+                    self.message_queue.put(
+                        f"Successfully {operation_past_tense} and renamed {source_filename} to {dest_filename}"
+                    )
+                else:
+                    self.message_queue.put(
+                        f"Successfully {operation_past_tense} {source_filename}"
+                    )
+            else:
+                # Process directory
+                if operation.operation_type == "copy":
+                    shutil.copytree(
+                        operation.source,
+                        operation.dest,
+                        dirs_exist_ok=True
+                    )
+                    operation_past_tense = "copied"
+                else:  # move operation
+                    shutil.move(operation.source, operation.dest)
+                    operation_past_tense = "moved"
+            
+                self.message_queue.put(
+                    f"Successfully {operation_past_tense} folder: {os.path.basename(operation.source)}"
+                )
+
+            return True
+
+        except Exception as e:
+            self.message_queue.put(
+                f"Error processing {os.path.basename(operation.source)}: {str(e)}"
+            )
+            self.logger.error(f"Error processing {os.path.basename(operation.source)}: {str(e)}")
+            import traceback
+            self.logger.error(traceback.format_exc())
+            return False
+
     def _update_preview(self):
         """Update the queued files display with preview of operations."""
         if not self.queued_files_text:
@@ -612,6 +719,7 @@ class FileMoverModule(BaseModule):
         """Sync the module's queue with the main file list using resolved paths."""
         # Convert all paths to Path objects with resolved paths
         self.queued_files = []
+        self._queue_dirty = False
         for fp in file_paths:
             path = Path(fp)
             if path.exists():
@@ -640,30 +748,40 @@ class FileMoverModule(BaseModule):
         self.message_queue.put("Operation cancelled by user")
         self.cancel_btn.configure(state="disabled")
 
-    def process_queues(self) -> None:
-        """Process message and progress queues."""
-        try:
-            # Process all pending messages
-            while True:
-                try:
-                    message = self.message_queue.get_nowait()
-                    # Log message to main application
-                    self.logger.info(message)
-                except queue.Empty:
-                    break
-
-            # Process progress updates
+    def process_queues(self) -> bool:
+        """Process message and progress queues; returns True if any were waiting."""
+        handled = False
+        # Process all pending messages
+        while True:
             try:
-                progress, status = self.progress_queue.get_nowait()
-                self.progress_var.set(progress)
-                self.status_var.set(status)
+                message = self.message_queue.get_nowait()
+                handled = True
+                # Log message to main application
+                self.logger.info(message)
             except queue.Empty:
-                pass
+                break
 
-        finally:
-            # Schedule next queue check if module is enabled
-            if self.enabled and hasattr(self, 'progress_bar'):
-                self.progress_bar.after(100, self.process_queues)
+        # Process progress updates; only the newest one needs showing
+        latest = None
+        while True:
+            try:
+                latest = self.progress_queue.get_nowait()
+            except queue.Empty:
+                break
+        if latest is not None:
+            handled = True
+            progress, status = latest
+            self.progress_var.set(progress)
+            self.status_var.set(status)
+
+        # Rebuild preview and destinations once for files added since last poll
+        if self._queue_dirty:
+            self._queue_dirty = False
+            handled = True
+            self._update_preview()
+            if self.dest_path and self.dest_path.get():
+                self._update_queue_destination()
+        return handled
 
     def debug_filename_parsing(self, test_files=None):
         """Test the filename parsing to identify any issues."""
@@ -12,6 +12,10 @@ from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Patterns used by clean_title on every filename
+_SEPARATOR_RE = re.compile(r'[._]')
+_UNWANTED_CHARS_RE = re.compile(r'[^\w\s-]')
+
 @dataclass
 class MediaInfo:
     title: str
@@ -46,12 +50,14 @@ class FilenameParser:
             # Handle cases with spaces like "Movie Name 2020 (1080p)"
             r'^(.*?)\s+(\d{4})\s+(?:\(.*?\)|\[.*?\]|.*?)$',
         ]
+        self.movie_patterns = [re.compile(pattern) for pattern in self.movie_patterns]
         
         # Define patterns to AVOID matching as years (resolutions, etc.)
         self.non_year_patterns = [
             r'1080p', r'1080i', r'720p', r'720i', r'480p', r'480i', r'2160p', r'4k',
             r'4K', r'UHD', r'x264', r'x265', r'HEVC', r'XVID', r'MP4', r'MKV',
         ]
+        self.non_year_patterns = [re.compile(pattern, re.IGNORECASE) for pattern in self.non_year_patterns]
         
         self.tv_patterns = [
             # Pattern: Show.Name.S01E02...
@@ -59,13 +65,14 @@ class FilenameParser:
             # Pattern: Show.Name.1x02...
             r'^((?:[A-Za-z0-9.]+[. ])*?)(\d{1,2})x(\d{1,2})',
         ]
+        self.tv_patterns = [re.compile(pattern) for pattern in self.tv_patterns]
 
     def clean_title(self, title: str) -> str:
         """Clean up title by replacing dots/underscores with spaces and proper capitalization"""
         # Replace dots and underscores with spaces
-        title = re.sub(r'[._]', ' ', title)
+        title = _SEPARATOR_RE.sub(' ', title)
         # Remove any remaining unwanted characters
-        title = re.sub(r'[^\w\s-]', '', title)
+        title = _UNWANTED_CHARS_RE.sub('', title)
         # Proper title case
         title = ' '.join(word.capitalize() for word in title.split())
         return title.strip()
@@ -76,9 +83,9 @@ class FilenameParser:
         
         # Try TV show patterns first
         for pattern in self.tv_patterns:
-            match = re.match(pattern, filename)
+            match = pattern.match(filename)
             if match:
-                logger.debug(f"Matched TV pattern: {pattern}")
+                logger.debug(f"Matched TV pattern: {pattern.pattern}")
                 title = self.clean_title(match.group(1))
                 return MediaInfo(
                     title=title,
@@ -88,15 +95,15 @@ class FilenameParser:
         
         # Try movie patterns
         for pattern in self.movie_patterns:
-            match = re.match(pattern, filename)
+            match = pattern.match(filename)
             if match:
-                logger.debug(f"Matched movie pattern: {pattern}")
+                logger.debug(f"Matched movie pattern: {pattern.pattern}")
                 title = self.clean_title(match.group(1))
                 year = match.group(2)
                 
                 # Skip if the "year" is actually a resolution or codec
                 year_text = f"{year}p" if year else ""
-                if any(re.search(non_year, year_text, re.IGNORECASE) for non_year in self.non_year_patterns):
+                if any(non_year.search(year_text) for non_year in self.non_year_patterns):
                     logger.debug(f"Skipping matched year '{year}' because it appears to be a resolution/codec")
                     continue
                 
@@ -213,9 +220,12 @@ class FileNameEditorModule(BaseModule):
             command=self._apply_changes
         ).pack(side='left', padx=5)
         
+        # Show anything queued before the settings tab was first opened
+        self._update_preview()
+        
         return frame
 
-    def process_file(self, file_path: Path, dest_path: Path) -> bool:
+    def process_file(self, file_path: str, dest_path: str) -> bool:
         """Queue a file for processing with improved path handling."""
         try:
             # Ensure we're working with Path objects
@@ -6,6 +6,10 @@ import logging
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
+# Patterns used by clean_title on every filename
+_SEPARATOR_RE = re.compile(r'[._]')
+_UNWANTED_CHARS_RE = re.compile(r'[^\w\s-]')
+
 @dataclass
 class MediaInfo:
     title: str
@@ -25,6 +29,7 @@ class FilenameParser:
             r'^(.*?)[_\-\.\s]\((\d{4})\)',  # Title followed by (year)
             r'^(.*?)[\.\s]\[(\d{4})\]'      # Title followed by [year]
         ]
+        self.movie_patterns = [re.compile(pattern) for pattern in self.movie_patterns]
         
         self.tv_patterns = [
             # Pattern: Show.Name.S01E02...
@@ -32,13 +37,14 @@ class FilenameParser:
             # Pattern: Show.Name.1x02...
             r'^((?:[A-Za-z0-9.]+[. ])*?)(\d{1,2})x(\d{1,2})',
         ]
+        self.tv_patterns = [re.compile(pattern) for pattern in self.tv_patterns]
 
     def clean_title(self, title: str) -> str:
         """Clean up title by replacing dots/underscores with spaces and proper capitalization"""
         # Replace dots and underscores with spaces
-        title = re.sub(r'[._]', ' ', title)
+        title = _SEPARATOR_RE.sub(' ', title)
         # Remove any remaining unwanted characters
-        title = re.sub(r'[^\w\s-]', '', title)
+        title = _UNWANTED_CHARS_RE.sub('', title)
         # Proper title case
         title = ' '.join(word.capitalize() for word in title.split())
         return title.strip()
@@ -49,9 +55,9 @@ class FilenameParser:
         
         # Try TV show patterns first
         for pattern in self.tv_patterns:
-            match = re.match(pattern, filename)
+            match = pattern.match(filename)
             if match:
-                logger.debug(f"Matched TV pattern: {pattern}")
+                logger.debug(f"Matched TV pattern: {pattern.pattern}")
                 title = self.clean_title(match.group(1))
                 return MediaInfo(
                     title=title,
@@ -61,9 +67,9 @@ class FilenameParser:
         
         # Try movie patterns
         for pattern in self.movie_patterns:
-            match = re.match(pattern, filename)
+            match = pattern.match(filename)
             if match:
-                logger.debug(f"Matched movie pattern: {pattern}")
+                logger.debug(f"Matched movie pattern: {pattern.pattern}")
                 title = self.clean_title(match.group(1))
                 return MediaInfo(
                     title=title,
@@ -70,7 +70,7 @@ class MediaSorterModule(BaseModule):
         self.queued_files: List[Path] = []
 
         # API Usage Tracker
-        self.api_tracker = APIUsageTracker()
+        self.api_tracker = APIUsageTracker.shared()
 
         # Module references
         self.file_mover = None  # Will be set in main.py
@@ -323,6 +323,9 @@ class MediaSorterModule(BaseModule):
             command=self._preprocess_queued_filenames
         ).pack(side='left', padx=5)
         
+        # Show anything queued before the settings tab was first opened
+        self._update_queue_display()
+        
         return frame
   
     def _show_analysis_results(self, results, failed, skipped):
@@ -951,7 +954,7 @@ class MediaSorterModule(BaseModule):
         # Re-run file analysis to show complete results
         self._analyze_files()
     
-    def process_file(self, file_path: Path, dest_path: Path) -> bool:
+    def process_file(self, file_path: str, dest_path: str) -> bool:
         """Queue a file for processing with improved path handling."""
         try:
             # Ensure we're working with Path objects
@@ -1219,7 +1222,6 @@ class MediaSorterModule(BaseModule):
                     
                         # Execute the operation
                         if operation_type == "copy":
-                            import shutil
                             # Check if destination exists
                             if dest_path.exists():
                                 add_log(f"Warning: Destination file already exists: {dest_path}")
@@ -1233,7 +1235,7 @@ class MediaSorterModule(BaseModule):
                                 add_log(f"Using alternative name: {dest_path.name}")
                         
                             # Copy the file
-                            shutil.copy2(source_path, dest_path)
+                            self._fast_copy(source_path, dest_path)
                             add_log(f"Copied: {source_path.name} -> {dest_path}")
                         else:  # move
                             # Check if destination exists
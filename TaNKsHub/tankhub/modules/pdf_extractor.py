@@ -58,11 +58,16 @@ class PDFExtractorModule(BaseModule):
         self.output_preview = None
         self.cancel_btn = None
         
+    @property
+    def always_poll(self) -> bool:
+        """Keep polling in the background while a job is running."""
+        return self.processing
+
     def get_supported_extensions(self) -> List[str]:
         """Define which file types this module can handle."""
         return ['.pdf']
 
-    def process_file(self, file_path: Path, dest_path: Path) -> bool:
+    def process_file(self, file_path: str, dest_path: str) -> bool:
         """Queue a PDF file for processing."""
         try:
             # Ensure we're working with Path objects
@@ -345,7 +350,7 @@ class PDFExtractorModule(BaseModule):
             
             if file_paths:
                 for path in file_paths:
-                    self.process_file(Path(path), None)
+                    self.process_file(path, None)
                 
         except Exception as e:
             self.logger.error(f"Error adding files: {str(e)}")
@@ -926,30 +931,32 @@ class PDFExtractorModule(BaseModule):
         self.message_queue.put("Operation cancelled by user")
         self.cancel_btn.configure(state="disabled")
     
-    def process_queues(self):
-        """Process message and progress queues."""
-        try:
-            # Process all pending messages
-            while True:
-                try:
-                    message = self.message_queue.get_nowait()
-                    self.status_var.set(message)
-                    self.logger.info(message)
-                except queue.Empty:
-                    break
+    def process_queues(self) -> bool:
+        """Process message and progress queues; returns True if any were waiting."""
+        handled = False
+        # Process all pending messages
+        while True:
+            try:
+                message = self.message_queue.get_nowait()
+                handled = True
+                self.status_var.set(message)
+                self.logger.info(message)
+            except queue.Empty:
+                break
 
-            # Process progress updates
+        # Process progress updates; only the newest one needs showing
+        latest = None
+        while True:
             try:
-                progress, status = self.progress_queue.get_nowait()
-                self.progress_var.set(progress)
-                self.status_var.set(status)
+                latest = self.progress_queue.get_nowait()
             except queue.Empty:
-                pass
-            
-        finally:
-            # Schedule next queue check if module is enabled
-            if self.enabled and hasattr(self, 'progress_bar'):
-                self.progress_bar.after(100, self.process_queues)
+                break
+        if latest is not None:
+            handled = True
+            progress, status = latest
+            self.progress_var.set(progress)
+            self.status_var.set(status)
+        return handled
     
     def save_settings(self) -> Dict[str, Any]:
         """Save current settings to dictionary."""
@@ -1099,12 +1106,10 @@ class PDFExtractorModule(BaseModule):
             chunks = self._chunk_text(ai_text, chunk_size)
         
             # Add chunk markers
-            chunked_text = ""
-            for i, chunk in enumerate(chunks):
-                chunked_text += f"\n\n<!-- CHUNK {i+1} OF {len(chunks)} -->\n\n"
-                chunked_text += chunk
-            
-            ai_text = chunked_text
+            ai_text = "".join(
+                f"\n\n<!-- CHUNK {i+1} OF {len(chunks)} -->\n\n{chunk}"
+                for i, chunk in enumerate(chunks)
+            )
     
         # Add a final note for AI processing
         ai_text += "\n\n<!-- END OF DOCUMENT -->"
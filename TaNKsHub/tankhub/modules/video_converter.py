@@ -22,7 +22,7 @@ class VideoConverterModule(BaseModule):
         """Define which file types this module can handle."""
         return ['.mp4', '.avi', '.mkv', '.mov', '.wmv']
 
-    def process_file(self, file_path: Path, dest_path: Path) -> bool:
+    def process_file(self, file_path: str, dest_path: str) -> bool:
         """Queue a file for processing."""
         try:
             file_path = Path(file_path) if not isinstance(file_path, Path) else file_path
@@ -96,6 +96,9 @@ class VideoConverterModule(BaseModule):
             ).pack(pady=10)
             
             self.logger.info("Settings widget created successfully")
+            # Show anything queued before the settings tab was first opened
+            self._update_ui()
+            
             return frame
             
         except Exception as e: